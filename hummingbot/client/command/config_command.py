@@ -81,12 +81,20 @@ client_configs_to_display = ["autofill_import",
                              "commands_timeout",
                              "create_command_timeout",
                              "other_commands_timeout",
+                             "http_connection_pool",
+                             "http_connections_limit",
+                             "http_connections_limit_per_host",
+                             "http_keepalive_timeout",
+                             "http_dns_cache_ttl",
+                             "http_prewarm_connections",
                              "tables_format",
                              "tick_size",
                              "market_data_collection",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_sink",
+                             "market_data_retention_days",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -63,6 +63,7 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        self._flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(self.init_time * 1e3),
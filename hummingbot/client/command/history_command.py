@@ -3,12 +3,12 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -41,6 +41,16 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        accumulators = self._get_performance_accumulators(start_time)
+        if accumulators is not None:
+            if not accumulators:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            safe_ensure_future(self.performance_report(start_time, accumulators, precision))
+            return
+        self._flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -58,6 +68,7 @@ class HistoryCommand:
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        self._flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -76,23 +87,87 @@ class HistoryCommand:
         return_pcts = []
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
+            cur_balances = await self._get_current_balances_for_report(market)
             perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
+        return self._report_averaged_return(return_pcts, display_report)
+
+    async def performance_report(self,  # type: HummingbotApplication
+                                 start_time: float,
+                                 accumulators: Dict[Tuple[str, str], PerformanceAccumulator],
+                                 precision: Optional[int] = None,
+                                 display_report: bool = True) -> Decimal:
+        """
+        Same report as history_report, from the running totals of the trades kept by the markets recorder.
+        The trades are only loaded for derivative markets, to pair the positions.
+        """
+        if display_report:
+            self.report_header(start_time)
+        return_pcts = []
+        for (market, symbol), accumulator in accumulators.items():
+            cur_balances = await self._get_current_balances_for_report(market)
+            cur_trades = self._get_market_trades(start_time, market, symbol) if accumulator.is_derivative else None
+            perf = await PerformanceMetrics.create_from_accumulator(accumulator, cur_balances, cur_trades)
+            if display_report:
+                self.report_performance_by_market(market, symbol, perf, precision)
+            return_pcts.append(perf.return_pct)
+        return self._report_averaged_return(return_pcts, display_report)
+
+    def _report_averaged_return(self,  # type: HummingbotApplication
+                                return_pcts: List[Decimal],
+                                display_report: bool) -> Decimal:
         avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
         if display_report and len(return_pcts) > 1:
             self.notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def _get_performance_accumulators(self,  # type: HummingbotApplication
+                                      start_time: float) -> Optional[Dict[Tuple[str, str], PerformanceAccumulator]]:
+        """
+        Returns the running totals of the trades kept by the markets recorder, if they cover the trades of the
+        current strategy since the start time
+        """
+        if self.markets_recorder is None or self.markets_recorder.config_file_path != self.strategy_file_name:
+            return None
+        return self.markets_recorder.get_performance_accumulators(int(start_time * 1e3))
+
+    def _flush_recorded_trades(self,  # type: HummingbotApplication
+                               ):
+        """
+        Writes the fills still queued by the markets recorder, so the trades read from the database are up to date
+        """
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush_pending_writes()
+
+    def _get_market_trades(self,  # type: HummingbotApplication
+                           start_time: float,
+                           market: str,
+                           trading_pair: str) -> List[TradeFill]:
+        # The positions are paired from these trades, so they must include the fills counted by the accumulators
+        self._flush_recorded_trades()
+        with self.trade_fill_db.get_new_session() as session:
+            return (session
+                    .query(TradeFill)
+                    .filter(TradeFill.timestamp >= int(start_time * 1e3),
+                            TradeFill.config_file_path == self.strategy_file_name,
+                            TradeFill.market == market,
+                            TradeFill.symbol == trading_pair)
+                    .order_by(TradeFill.timestamp.asc())
+                    .all())
+
+    async def _get_current_balances_for_report(self,  # type: HummingbotApplication
+                                               market: str) -> Dict[str, Decimal]:
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            return await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -207,7 +282,11 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
+        accumulators = self._get_performance_accumulators(start_time)
+        if accumulators is not None:
+            return await self.performance_report(start_time, accumulators, display_report=False)
 
+        self._flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -224,6 +303,7 @@ class HistoryCommand:
 
         lines = []
 
+        self._flush_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
             queried_trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -77,8 +77,22 @@ class StatusCommand:
         else:
             st_status = self.strategy.format_status()
         status = paper_trade + "\n" + st_status
+        if self.clock is not None:
+            status += "\n" + self._format_clock_tick_stats()
         return status
 
+    def _format_clock_tick_stats(self,  # type: HummingbotApplication
+                                 ) -> str:
+        tick_stats = self.clock.tick_stats
+        lines = [f"\n  Clock (tick size {self.clock.tick_size}s): {tick_stats.ticks} ticks, "
+                 f"{tick_stats.early_ticks} early ticks, {tick_stats.missed_ticks} missed ticks, "
+                 f"{tick_stats.overruns} overruns, max tick duration {tick_stats.max_duration * 1e3:.2f} ms"]
+        for iterator, iterator_stats in self.clock.iterator_tick_stats.items():
+            lines.append(f"    {type(iterator).__name__}: mean {iterator_stats.mean_duration * 1e3:.2f} ms, "
+                         f"max {iterator_stats.max_duration * 1e3:.2f} ms, "
+                         f"last {iterator_stats.last_duration * 1e3:.2f} ms")
+        return "\n".join(lines)
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -26,6 +26,10 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionPoolSettings,
+    set_default_connection_pool_settings,
+)
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 
 if TYPE_CHECKING:
@@ -141,6 +145,11 @@ class MQTTBridgeConfigMap(BaseClientModel):
         title = "mqtt_bridge"
 
 
+class MarketDataCollectionSinkEnum(str, ClientConfigEnum):
+    database = "database"
+    file = "file"
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=False,
@@ -168,6 +177,31 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_sink: MarketDataCollectionSinkEnum = Field(
+        default=MarketDataCollectionSinkEnum.database,
+        description="Where the market data is stored: the MarketData table or daily CSV files in data/market_data",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Where do you want to store the market data? ({'/'.join(list(MarketDataCollectionSinkEnum))})"
+            ),
+        ),
+    )
+    market_data_retention_days: int = Field(
+        default=0,
+        ge=0,
+        description="Days of market data kept, including the current one. Older days are deleted (0 keeps everything)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the number of days of market data to keep (Default=0, keeps all the data)"
+            ),
+        ),
+    )
+
+    @validator("market_data_collection_sink", pre=True)
+    def validate_market_data_collection_sink(cls, v: Union[str, MarketDataCollectionSinkEnum]):
+        if isinstance(v, str) and v not in MarketDataCollectionSinkEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(MarketDataCollectionSinkEnum))}.")
+        return v
 
     class Config:
         title = "market_data_collection"
@@ -417,11 +451,33 @@ TELEGRAM_MODES = {
 }
 
 
+SQLITE_JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SQLITE_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
 class DBMode(BaseClientModel, ABC):
     @abstractmethod
     def get_url(self, db_path: str) -> str:
         ...
 
+    def get_connection_pragmas(self) -> Dict[str, Union[str, int]]:
+        """
+        Returns the PRAGMA statements (name and value) run on every new database connection
+        """
+        return {}
+
+    def get_pool_size(self) -> Optional[int]:
+        """
+        Returns the number of connections kept open for reuse (None to use the engine default pool)
+        """
+        return None
+
+    def get_maintenance_interval(self) -> float:
+        """
+        Returns the hours between database maintenance runs (0 disables the maintenance)
+        """
+        return 0
+
 
 class DBSqliteMode(DBMode):
     db_engine: str = Field(
@@ -434,12 +490,88 @@ class DBSqliteMode(DBMode):
         ),
     )
 
+    db_journal_mode: str = Field(
+        default="WAL",
+        description="SQLite journal mode. WAL lets the readers work while the trades are being written",
+        client_data=ClientFieldData(
+            prompt=lambda cm: f"Please enter the SQLite journal mode ({'/'.join(SQLITE_JOURNAL_MODES)})",
+        ),
+    )
+    db_synchronous: str = Field(
+        default="NORMAL",
+        description="SQLite synchronous setting. NORMAL is safe from corruption in WAL mode and syncs less often",
+        client_data=ClientFieldData(
+            prompt=lambda cm: f"Please enter the SQLite synchronous setting ({'/'.join(SQLITE_SYNCHRONOUS_MODES)})",
+        ),
+    )
+    db_mmap_size: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Bytes of the database file accessed with memory-mapped I/O (0 disables it)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the SQLite memory-mapped I/O size in bytes",
+        ),
+    )
+    db_cache_size: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="KiB of page cache per database connection",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the SQLite page cache size in KiB",
+        ),
+    )
+    db_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Database connections kept open and reused by the sessions (shared with the writer thread)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the number of database connections kept open",
+        ),
+    )
+    db_maintenance_interval: float = Field(
+        default=24,
+        ge=0,
+        description="Hours between runs of ANALYZE and incremental vacuum on the database (0 disables them)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Please enter the hours between database maintenance runs (0 to disable them)",
+        ),
+    )
+
     class Config:
         title = "sqlite_db_engine"
 
     def get_url(self, db_path: str) -> str:
         return f"{self.db_engine}:///{db_path}"
 
+    def get_connection_pragmas(self) -> Dict[str, Union[str, int]]:
+        return {
+            "journal_mode": self.db_journal_mode,
+            "synchronous": self.db_synchronous,
+            "mmap_size": self.db_mmap_size,
+            # Negative values are KiB, positive ones are pages
+            "cache_size": -self.db_cache_size,
+            # Only applies to databases created after the change, the rest need a VACUUM first
+            "auto_vacuum": "INCREMENTAL",
+        }
+
+    def get_pool_size(self) -> Optional[int]:
+        return self.db_pool_size
+
+    def get_maintenance_interval(self) -> float:
+        return self.db_maintenance_interval
+
+    @validator("db_journal_mode", pre=True)
+    def validate_db_journal_mode(cls, v: str):
+        if v.upper() not in SQLITE_JOURNAL_MODES:
+            raise ValueError(f"The value must be one of {', '.join(SQLITE_JOURNAL_MODES)}.")
+        return v.upper()
+
+    @validator("db_synchronous", pre=True)
+    def validate_db_synchronous(cls, v: str):
+        if v.upper() not in SQLITE_SYNCHRONOUS_MODES:
+            raise ValueError(f"The value must be one of {', '.join(SQLITE_SYNCHRONOUS_MODES)}.")
+        return v.upper()
+
 
 class DBOtherMode(DBMode):
     db_engine: str = Field(
@@ -586,6 +718,81 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         return super().validate_decimal(v, field)
 
 
+class HTTPConnectionPoolConfigMap(BaseClientModel):
+    http_connections_limit: int = Field(
+        default=100,
+        ge=0,
+        description="Maximum number of HTTP connections open at the same time (0 means no limit)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of HTTP connections open at the same time (Default=100, 0 means no limit)"
+            ),
+        ),
+    )
+    http_connections_limit_per_host: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum number of HTTP connections open at the same time to the same host (0 means no limit)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Maximum number of HTTP connections open at the same time to the same host (Default=0, no limit)"
+            ),
+        ),
+    )
+    http_keepalive_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds an idle HTTP connection is kept open to be reused",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many seconds should an idle HTTP connection be kept open to be reused? (Default=30)"
+            ),
+        ),
+    )
+    http_dns_cache_ttl: int = Field(
+        default=60,
+        ge=0,
+        description="Seconds the resolved addresses of a host are reused (0 disables the DNS cache)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many seconds should the resolved addresses of a host be cached? (Default=60, 0 disables it)"
+            ),
+        ),
+    )
+    http_prewarm_connections: int = Field(
+        default=0,
+        ge=0,
+        description="HTTP connections opened to the exchange when a connector starts trading, so the first orders do"
+                    " not wait for the TCP and TLS handshakes",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many HTTP connections should be opened to the exchange when a connector starts trading? "
+                "(Default=0)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "http_connection_pool"
+
+    # === post-validations ===
+
+    @root_validator()
+    def post_validations(cls, values: Dict):
+        cls.http_connection_pool_on_validated(values)
+        return values
+
+    @classmethod
+    def http_connection_pool_on_validated(cls, values: Dict):
+        set_default_connection_pool_settings(ConnectionPoolSettings(
+            limit=values["http_connections_limit"],
+            limit_per_host=values["http_connections_limit_per_host"],
+            keepalive_timeout=values["http_keepalive_timeout"],
+            dns_cache_ttl=values["http_dns_cache_ttl"],
+            prewarm_connections=values["http_prewarm_connections"],
+        ))
+
+
 class AnonymizedMetricsMode(BaseClientModel, ABC):
     @abstractmethod
     def get_collector(
@@ -1061,6 +1268,7 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
+    http_connection_pool: HTTPConnectionPoolConfigMap = Field(default=HTTPConnectionPoolConfigMap())
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
         names={e: e for e in tabulate_formats},
@@ -1079,7 +1287,7 @@ class ClientConfigMap(BaseClientModel):
     color: ColorConfigMap = Field(default=ColorConfigMap())
     tick_size: float = Field(
         default=1.0,
-        ge=0.1,
+        ge=0.01,
         description="The tick size is the frequency with which the clock notifies the time iterators by calling the"
                     "\nc_tick() method, that means for example that if the tick size is 1, the logic of the strategy"
                     " \nwill run every second.",
@@ -1188,7 +1396,7 @@ class ClientConfigMap(BaseClientModel):
     @validator("tick_size", pre=True)
     def validate_tick_size(cls, v: float):
         """Used for client-friendly error output."""
-        ret = validate_float(v, min_value=0.1)
+        ret = validate_float(v, min_value=0.01)
         if ret is not None:
             raise ValueError(ret)
         return v
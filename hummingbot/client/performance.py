@@ -1,9 +1,12 @@
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd
+
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
@@ -15,6 +18,235 @@ s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+@dataclass
+class PerformanceAccumulator:
+    """
+    Running totals of the trades of one market and trading pair. They are updated one fill at a time, so the
+    performance metrics can be built without going through the whole list of trades again.
+    """
+    trading_pair: str
+
+    num_buys: int = 0
+    num_sells: int = 0
+
+    b_vol_base: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+
+    start_price: Optional[Decimal] = None
+    last_price: Optional[Decimal] = None
+
+    # Whether buys (sells) with no position action were found, to tell derivative trades apart
+    has_nil_position_buys: bool = False
+    has_nil_position_sells: bool = False
+
+    # fees is a dictionary of token and total fee amount paid in that token.
+    fees: Dict[str, Decimal] = field(default_factory=dict)
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        """
+        True when the trades open and close positions. The trade P&L of derivatives comes from pairing the positions,
+        so it still needs the list of trades.
+        """
+        return ((self.num_buys > 0 and not self.has_nil_position_buys)
+                or (self.num_sells > 0 and not self.has_nil_position_sells))
+
+    @classmethod
+    def from_trades(cls, trading_pair: str, trades: List[Any]) -> "PerformanceAccumulator":
+        accumulator = PerformanceAccumulator(trading_pair=trading_pair)
+        for trade in trades:
+            accumulator.add_trade(trade)
+        return accumulator
+
+    def add_trade(self, trade: Any):
+        """
+        :param trade: a TradeFill or Trade object
+        """
+        if isinstance(trade, TradeFill):
+            self.add_fill(trade.trade_type, trade.price, trade.amount, trade.trade_fee, trade.position)
+        else:  # assume this is Trade object
+            self.add_fill(trade.trade_type, trade.price, trade.amount, trade.trade_fee.to_json(),
+                          PositionAction.NIL.value)
+
+    def add_fill(self,
+                 trade_type: str,
+                 price: Decimal,
+                 amount: Decimal,
+                 trade_fee: Dict[str, Any],
+                 position: str = PositionAction.NIL.value):
+        """
+        Adds a fill to the totals, the same way PerformanceMetrics processes the list of trades.
+        :param trade_type: the trade type name (BUY or SELL)
+        :param trade_fee: the trade fee in JSON format (see TradeFeeBase.to_json)
+        :param position: the position action value of the fill
+        """
+        price = Decimal(str(price))
+        amount = Decimal(str(amount))
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+
+        if trade_type.upper() == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+            self.has_nil_position_buys |= position == PositionAction.NIL.value
+        elif trade_type.upper() == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+            self.has_nil_position_sells |= position == PositionAction.NIL.value
+
+        if trade_fee.get("percent") is not None:
+            fee_percent = Decimal(str(trade_fee["percent"]))
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote += amount * price * fee_percent * Decimal("-1")
+            quote = split_hb_trading_pair(self.trading_pair)[1]
+            self.fees[quote] = self.fees.get(quote, s_decimal_0) + price * amount * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] = self.fees.get(flat_fee["token"], s_decimal_0) + Decimal(flat_fee["amount"])
+
+    def add_accumulator(self, other: "PerformanceAccumulator"):
+        """
+        Adds the totals of fills that came after the fills of this accumulator
+        """
+        if self.start_price is None:
+            self.start_price = other.start_price
+        if other.last_price is not None:
+            self.last_price = other.last_price
+        self.num_buys += other.num_buys
+        self.num_sells += other.num_sells
+        self.b_vol_base += other.b_vol_base
+        self.s_vol_base += other.s_vol_base
+        self.b_vol_quote += other.b_vol_quote
+        self.s_vol_quote += other.s_vol_quote
+        self.has_nil_position_buys |= other.has_nil_position_buys
+        self.has_nil_position_sells |= other.has_nil_position_sells
+        for token, amount in other.fees.items():
+            self.fees[token] = self.fees.get(token, s_decimal_0) + amount
+
+    @classmethod
+    def from_trades_frame(cls, trading_pair: str, trades: pd.DataFrame, scale: int) -> "PerformanceAccumulator":
+        """
+        Computes the totals of a whole history of fills at once, with array operations instead of processing the
+        fills one by one. This is meant for full history audits and to rebuild the running totals.
+        :param trades: one row per fill in timestamp order, with the trade_type, price, amount, trade_fee and position
+            columns. price and amount are the integers stored in the TradeFill table, i.e. the values times 10 ** scale
+        :param scale: the number of decimal digits of the price and amount integers
+        """
+        accumulator = PerformanceAccumulator(trading_pair=trading_pair)
+        if len(trades) == 0:
+            return accumulator
+        quote = split_hb_trading_pair(trading_pair)[1]
+
+        sides = trades["trade_type"].str.upper().to_numpy()
+        is_buy = sides == TradeType.BUY.name.upper()
+        is_sell = sides == TradeType.SELL.name.upper()
+        is_nil_position = trades["position"].to_numpy() == PositionAction.NIL.value
+        prices = trades["price"].to_numpy(dtype=np.int64)
+        amounts = trades["amount"].to_numpy(dtype=np.int64)
+        notionals = cls._exact_products(prices, amounts)
+
+        def to_decimal(value: int, value_scale: int) -> Decimal:
+            return Decimal(int(value)).scaleb(-value_scale)
+
+        accumulator.num_buys = int(is_buy.sum())
+        accumulator.num_sells = int(is_sell.sum())
+        accumulator.b_vol_base = to_decimal(amounts[is_buy].sum(), scale)
+        accumulator.b_vol_quote = to_decimal(notionals[is_buy].sum(), 2 * scale) * Decimal("-1")
+        accumulator.s_vol_base = to_decimal(amounts[is_sell].sum(), scale) * Decimal("-1")
+        accumulator.s_vol_quote = to_decimal(notionals[is_sell].sum(), 2 * scale)
+        accumulator.start_price = to_decimal(prices[0], scale)
+        accumulator.last_price = to_decimal(prices[-1], scale)
+        accumulator.has_nil_position_buys = bool(is_nil_position[is_buy].any())
+        accumulator.has_nil_position_sells = bool(is_nil_position[is_sell].any())
+
+        # There are only a few distinct fee percentages, so the fees are computed per percentage
+        fee_percents = trades["trade_fee"].map(lambda fee: fee.get("percent")).to_numpy()
+        is_deducted = (trades["trade_fee"].map(lambda fee: fee.get("fee_type")).to_numpy()
+                       == DeductedFromReturnsTradeFee.type_descriptor_for_json())
+        with_percent = pd.notnull(fee_percents)
+        if with_percent.any():
+            accumulator.fees[quote] = s_decimal_0
+        for fee_percent in pd.unique(fee_percents[with_percent]):
+            rows = fee_percents == fee_percent
+            fee_percent = Decimal(str(fee_percent))
+            accumulator.fees[quote] += to_decimal(notionals[rows].sum(), 2 * scale) * fee_percent
+            deducted_rows = rows & is_deducted
+            if deducted_rows.any():
+                accumulator.s_vol_quote += (to_decimal(notionals[deducted_rows].sum(), 2 * scale) * fee_percent
+                                            * Decimal("-1"))
+
+        flat_fees = trades["trade_fee"].map(lambda fee: fee.get("flat_fees", [])).explode().dropna()
+        if len(flat_fees) > 0:
+            flat_fees = pd.DataFrame(flat_fees.tolist())
+            flat_fees["amount"] = flat_fees["amount"].map(Decimal)
+            for token, amount in flat_fees.groupby("token", sort=False)["amount"].sum().items():
+                accumulator.fees[token] = accumulator.fees.get(token, s_decimal_0) + amount
+
+        return accumulator
+
+    @classmethod
+    def from_trades_frame_by_market(cls,
+                                    trades: pd.DataFrame,
+                                    scale: int) -> Dict[Tuple[str, str], "PerformanceAccumulator"]:
+        """
+        Same as from_trades_frame for the fills of several markets (market and symbol columns)
+        :return: the totals by market and trading pair
+        """
+        return {
+            (market, symbol): cls.from_trades_frame(symbol, market_trades, scale)
+            for (market, symbol), market_trades in trades.groupby(["market", "symbol"], sort=False)
+        }
+
+    @staticmethod
+    def _exact_products(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        # int64 products (and their sum) are only used when they can't overflow, Python integers otherwise
+        bound = int(np.abs(a).max()) * int(np.abs(b).max()) * len(a)
+        if bound < np.iinfo(np.int64).max:
+            return a * b
+        return a.astype(object) * b.astype(object)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "trading_pair": self.trading_pair,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "s_vol_base": str(self.s_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_quote": str(self.s_vol_quote),
+            "start_price": str(self.start_price) if self.start_price is not None else None,
+            "last_price": str(self.last_price) if self.last_price is not None else None,
+            "has_nil_position_buys": self.has_nil_position_buys,
+            "has_nil_position_sells": self.has_nil_position_sells,
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PerformanceAccumulator":
+        return PerformanceAccumulator(
+            trading_pair=data["trading_pair"],
+            num_buys=data["num_buys"],
+            num_sells=data["num_sells"],
+            b_vol_base=Decimal(data["b_vol_base"]),
+            s_vol_base=Decimal(data["s_vol_base"]),
+            b_vol_quote=Decimal(data["b_vol_quote"]),
+            s_vol_quote=Decimal(data["s_vol_quote"]),
+            start_price=Decimal(data["start_price"]) if data["start_price"] is not None else None,
+            last_price=Decimal(data["last_price"]) if data["last_price"] is not None else None,
+            has_nil_position_buys=data["has_nil_position_buys"],
+            has_nil_position_sells=data["has_nil_position_sells"],
+            fees={token: Decimal(amount) for token, amount in data["fees"].items()},
+        )
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
@@ -71,6 +303,23 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_accumulator(cls,
+                                      accumulator: PerformanceAccumulator,
+                                      current_balances: Dict[str, Decimal],
+                                      trades: Optional[List[Any]] = None) -> 'PerformanceMetrics':
+        """
+        Builds the metrics from the running totals of the trades, without going through the trades.
+        :param accumulator: the totals of the trades of the trading pair
+        :param current_balances: current user account balance
+        :param trades: the list of TradeFill objects, only required for derivatives to pair the positions
+        """
+        if accumulator.is_derivative and trades is None:
+            raise ValueError("The trades are required to calculate the trade P&L of derivatives.")
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_accumulator(accumulator, current_balances, trades)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +445,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_totals_and_average_prices()
+
+        return buys, sells
+
+    def _calculate_totals_and_average_prices(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +460,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +500,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -295,22 +550,79 @@ class PerformanceMetrics:
         :param current_balances: current user account balance
         """
 
-        base, quote = split_hb_trading_pair(trading_pair)
+        quote = split_hb_trading_pair(trading_pair)[1]
         buys, sells = self._preprocess_trades_and_group_by_type(trades)
 
         self.num_buys = len(buys)
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_portfolio_values(trading_pair,
+                                               current_balances,
+                                               Decimal(str(trades[0].price)),
+                                               Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_accumulator(self,
+                                                   accumulator: PerformanceAccumulator,
+                                                   current_balances: Dict[str, Decimal],
+                                                   trades: Optional[List[Any]] = None):
+        """
+        Calculates PnL, fees, Return % and etc... from the totals of the trades
+        :param accumulator: the totals of the trades of the trading market
+        :param current_balances: current user account balance
+        :param trades: the list of TradeFill objects, used to pair the positions of derivatives
+        """
+        trading_pair = accumulator.trading_pair
+        quote = split_hb_trading_pair(trading_pair)[1]
+
+        self.num_buys = accumulator.num_buys
+        self.num_sells = accumulator.num_sells
+        self.num_trades = accumulator.num_trades
+        self.b_vol_base = accumulator.b_vol_base
+        self.s_vol_base = accumulator.s_vol_base
+        self.b_vol_quote = accumulator.b_vol_quote
+        self.s_vol_quote = accumulator.s_vol_quote
+        self._calculate_totals_and_average_prices()
+
+        await self._calculate_portfolio_values(trading_pair,
+                                               current_balances,
+                                               accumulator.start_price,
+                                               accumulator.last_price)
+        if accumulator.is_derivative:
+            buys = [t for t in trades if t.trade_type.upper() == TradeType.BUY.name.upper()]
+            sells = [t for t in trades if t.trade_type.upper() == TradeType.SELL.name.upper()]
+            self._calculate_trade_pnl(buys, sells)
+        else:
+            self.trade_pnl = self.cur_value - self.hold_value
+
+        self.fees.update(accumulator.fees)
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_portfolio_values(self,
+                                          trading_pair: str,
+                                          current_balances: Dict[str, Decimal],
+                                          start_price: Decimal,
+                                          last_trade_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
+
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +630,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
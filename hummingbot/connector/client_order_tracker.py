@@ -2,8 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +28,56 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class TrackedOrdersView(Mapping):
+    """
+    Read-only view of orders of a ClientOrderTracker that doesn't copy them.
+
+    Looking up an order is a dictionary lookup. Iterating goes over a snapshot of the orders taken when the iteration
+    starts, so the tracker can start and stop tracking orders while the caller iterates (e.g. in a loop that awaits
+    requests).
+    """
+
+    def __init__(self,
+                 lookup: Callable[[str], Optional[InFlightOrder]],
+                 snapshot: Callable[[], Dict[str, InFlightOrder]]):
+        self._lookup = lookup
+        self._snapshot = snapshot
+
+    def __getitem__(self, key: str) -> InFlightOrder:
+        order = self._lookup(key)
+        if order is None:
+            raise KeyError(key)
+        return order
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot())
+
+    def __len__(self) -> int:
+        return len(self._snapshot())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._snapshot()})"
+
+    def get(self, key: str, default: Optional[InFlightOrder] = None) -> Optional[InFlightOrder]:
+        order = self._lookup(key)
+        return default if order is None else order
+
+    def keys(self):
+        return self._snapshot().keys()
+
+    def values(self):
+        return self._snapshot().values()
+
+    def items(self):
+        return self._snapshot().items()
+
+    def copy(self) -> Dict[str, InFlightOrder]:
+        return self._snapshot()
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -58,6 +107,33 @@ class ClientOrderTracker:
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Indexes of the tracked orders, updated when the orders are tracked and checked against the orders
+        # containers when they are used, because cached orders expire without notice
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = {}
+        # Active orders by state, moved between buckets when the tracker processes their order and trade updates
+        self._open_orders: Dict[str, InFlightOrder] = {}
+        self._pending_cancel_orders: Dict[str, InFlightOrder] = {}
+        self._done_orders: Dict[str, InFlightOrder] = {}
+        self._open_orders_view = self._state_bucket_view(self._open_orders)
+        self._pending_cancel_orders_view = self._state_bucket_view(self._pending_cancel_orders)
+        self._done_orders_view = self._state_bucket_view(self._done_orders)
+        self._all_fillable_orders = TrackedOrdersView(
+            lookup=self._fetch_fillable_order,
+            snapshot=lambda: {**self._in_flight_orders, **self.cached_orders, **self._lost_orders})
+        self._all_updatable_orders = TrackedOrdersView(
+            lookup=self._fetch_updatable_order,
+            snapshot=lambda: {**self._in_flight_orders, **self._lost_orders})
+        self._all_fillable_orders_by_exchange_order_id = TrackedOrdersView(
+            lookup=lambda exchange_order_id: self._fetch_order_by_exchange_order_id(
+                exchange_order_id, self._fetch_fillable_order),
+            snapshot=lambda: {order.exchange_order_id: order for order in self._all_fillable_orders.values()})
+        self._all_updatable_orders_by_exchange_order_id = TrackedOrdersView(
+            lookup=lambda exchange_order_id: self._fetch_order_by_exchange_order_id(
+                exchange_order_id, self._fetch_updatable_order),
+            snapshot=lambda: {order.exchange_order_id: order for order in self._all_updatable_orders.values()})
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -84,39 +160,53 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders}
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return self._all_fillable_orders
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return self._all_fillable_orders_by_exchange_order_id
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return self._all_updatable_orders
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return self._all_updatable_orders_by_exchange_order_id
+
+    @property
+    def open_orders(self) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the active orders that are not done and not waiting for a cancel confirmation
+        """
+        return self._open_orders_view
+
+    @property
+    def pending_cancel_orders(self) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the active orders waiting for the exchange to confirm their cancellation
+        """
+        return self._pending_cancel_orders_view
+
+    @property
+    def done_orders(self) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the active orders that are done (filled, canceled or failed) but still tracked
+        """
+        return self._done_orders_view
 
     @property
     def current_timestamp(self) -> int:
@@ -142,14 +232,31 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair.setdefault(order.trading_pair, {})[order.client_order_id] = order
+        self._index_order(order)
+        self._update_state_bucket(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
+            self._cached_orders[client_order_id] = order
             del self._in_flight_orders[client_order_id]
+            trading_pair_orders = self._active_orders_by_trading_pair.get(order.trading_pair, {})
+            trading_pair_orders.pop(client_order_id, None)
+            if len(trading_pair_orders) == 0:
+                self._active_orders_by_trading_pair.pop(order.trading_pair, None)
+            self._remove_from_state_buckets(client_order_id)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
+    def active_orders_for_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the orders actively tracked for the trading pair, without going through the orders of other pairs
+        """
+        return TrackedOrdersView(
+            lookup=lambda client_order_id: self._active_orders_by_trading_pair.get(trading_pair, {}).get(client_order_id),
+            snapshot=lambda: dict(self._active_orders_by_trading_pair.get(trading_pair, {})))
+
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
         Restore in-flight orders from saved tracking states.
@@ -162,6 +269,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,43 +280,136 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._fetch_active_or_cached_order(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id, self._fetch_active_or_cached_order)
 
         return found_order
 
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._lost_orders.get(client_order_id)
 
-        if client_order_id in self._lost_orders:
-            found_order = self._lost_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id, self._lost_orders.get)
 
         return found_order
 
+    def _fetch_active_or_cached_order(self, client_order_id: str) -> Optional[InFlightOrder]:
+        order = self._cached_orders.get(client_order_id)
+        if order is None:
+            order = self._in_flight_orders.get(client_order_id)
+        return order
+
+    def _fetch_updatable_order(self, client_order_id: str) -> Optional[InFlightOrder]:
+        order = self._lost_orders.get(client_order_id)
+        if order is None:
+            order = self._in_flight_orders.get(client_order_id)
+        return order
+
+    def _fetch_fillable_order(self, client_order_id: str) -> Optional[InFlightOrder]:
+        order = self._lost_orders.get(client_order_id)
+        if order is None:
+            order = self._fetch_active_or_cached_order(client_order_id)
+        return order
+
+    def _fetch_order_by_exchange_order_id(
+        self, exchange_order_id: str, fetch_by_client_order_id: Callable[[str], Optional[InFlightOrder]]
+    ) -> Optional[InFlightOrder]:
+        """
+        Finds an order in the exchange order id index. The order is only returned if it is still the order with that
+        client order id for the fetch function, so expired and untracked orders are not returned.
+        """
+        if exchange_order_id is None:
+            return None
+        self._index_new_exchange_order_ids()
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None:
+            return None
+        if order.exchange_order_id != exchange_order_id:
+            # The exchange order id was changed after the order was indexed
+            del self._orders_by_exchange_order_id[exchange_order_id]
+            if self._fetch_fillable_order(order.client_order_id) is order:
+                self._index_order(order)
+            return None
+        if fetch_by_client_order_id(order.client_order_id) is not order:
+            return None
+        return order
+
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+        if len(self._orders_by_exchange_order_id) > 2 * (self.MAX_CACHE_SIZE + len(self._in_flight_orders) +
+                                                         len(self._lost_orders)):
+            self._rebuild_exchange_order_id_index()
+
+    def _index_new_exchange_order_ids(self):
+        # The exchange order id is usually assigned to the order after it starts being tracked
+        for client_order_id, order in list(self._orders_without_exchange_order_id.items()):
+            if order.exchange_order_id is not None:
+                del self._orders_without_exchange_order_id[client_order_id]
+                self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            elif self._fetch_fillable_order(client_order_id) is not order:
+                del self._orders_without_exchange_order_id[client_order_id]
+
+    def _rebuild_exchange_order_id_index(self):
+        # Removes the orders that expired from the cache or are no longer tracked
+        self._orders_by_exchange_order_id = {
+            order.exchange_order_id: order for order in self._all_fillable_orders.values()
+            if order.exchange_order_id is not None}
+
+    def _state_bucket(self, order: InFlightOrder) -> Dict[str, InFlightOrder]:
+        if order.is_done:
+            return self._done_orders
+        if order.is_pending_cancel_confirmation:
+            return self._pending_cancel_orders
+        return self._open_orders
+
+    def _state_bucket_view(self, bucket: Dict[str, InFlightOrder]) -> TrackedOrdersView:
+        # The state of an order can be changed without going through the tracker, so the orders are only returned if
+        # they still belong to the bucket. Such orders move to their bucket with the next update the tracker processes.
+        def lookup(client_order_id: str) -> Optional[InFlightOrder]:
+            order = bucket.get(client_order_id)
+            if order is None or self._state_bucket(order) is not bucket:
+                return None
+            return order
+
+        return TrackedOrdersView(
+            lookup=lookup,
+            snapshot=lambda: {client_order_id: order for client_order_id, order in bucket.items()
+                              if self._state_bucket(order) is bucket})
+
+    def _update_state_bucket(self, order: InFlightOrder):
+        if self._in_flight_orders.get(order.client_order_id) is not order:
+            return
+        bucket = self._state_bucket(order)
+        if order.client_order_id not in bucket:
+            self._remove_from_state_buckets(order.client_order_id)
+            bucket[order.client_order_id] = order
+
+    def _remove_from_state_buckets(self, client_order_id: str):
+        self._open_orders.pop(client_order_id, None)
+        self._pending_cancel_orders.pop(client_order_id, None)
+        self._done_orders.pop(client_order_id, None)
+
     def process_order_update(self, order_update: OrderUpdate):
         return safe_ensure_future(self._process_order_update(order_update))
 
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._fetch_fillable_order(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
+            self._update_state_bucket(tracked_order)
             if updated:
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
@@ -290,6 +491,7 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            self._update_state_bucket(tracked_order)
             if updated:
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -43,6 +43,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
     LONG_POLL_INTERVAL = 120.0
+    COALESCE_ORDER_BOOK_DIFFS = True
 
     def __init__(
             self,
@@ -32,6 +32,7 @@ if TYPE_CHECKING:
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    COALESCE_ORDER_BOOK_DIFFS = True
 
     web_utils = web_utils
 
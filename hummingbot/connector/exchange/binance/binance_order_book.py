@@ -4,7 +4,8 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
-    OrderBookMessageType
+    OrderBookMessageType,
+    order_book_entries_to_array,
 )
 
 
@@ -49,8 +50,8 @@ class BinanceOrderBook(OrderBook):
             "trading_pair": msg["trading_pair"],
             "first_update_id": msg["U"],
             "update_id": msg["u"],
-            "bids": msg["b"],
-            "asks": msg["a"]
+            "bids": order_book_entries_to_array(msg["b"]),
+            "asks": order_book_entries_to_array(msg["a"])
         }, timestamp=timestamp)
 
     @classmethod
@@ -14,8 +14,8 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
-from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowAsyncThrottler, request_priority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -29,6 +29,10 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionMetrics,
+    get_default_connection_pool_settings,
+)
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.logger import HummingbotLogger
@@ -45,6 +49,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Percentage of every rate limit that polling requests can not use, so order creation and cancellation requests
+    # always find capacity
+    CRITICAL_REQUESTS_RESERVE_PCT = 0.1
+    # Max number of order status and order trades requests sent at the same time when the orders are updated one by
+    # one. The requests still wait for the throttler, so the rate limits are respected
+    ORDER_UPDATES_CONCURRENCY = 10
+    # If True the order book tracker merges the diffs pending for a pair into one update before applying them. Useful
+    # for exchanges streaming diffs faster than they can be applied one by one
+    COALESCE_ORDER_BOOK_DIFFS = False
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,11 +73,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._connections_prewarm_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = SlidingWindowAsyncThrottler(
             rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+            limits_share_percentage=client_config_map.rate_limits_share_pct,
+            critical_reserve_pct=self.CRITICAL_REQUESTS_RESERVE_PCT)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -73,10 +88,12 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
+        self._orderbook_ds.order_book_create_function = self._create_order_book
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            coalesce_diffs=self.COALESCE_ORDER_BOOK_DIFFS))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -165,6 +182,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
 
+    @property
+    def connection_metrics(self) -> ConnectionMetrics:
+        """
+        Returns the new and reused HTTP connections, per host, of the requests sent to the exchange
+        """
+        return self._web_assistants_factory.connection_metrics
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         return {
@@ -449,7 +473,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
             return
         try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            with request_priority(RequestPriority.CRITICAL):
+                await self._place_order_and_process_update(order=order, **kwargs,)
 
         except asyncio.CancelledError:
             raise
@@ -517,7 +542,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
-            cancelled = await self._execute_order_cancel_and_process_update(order=order)
+            with request_priority(RequestPriority.CRITICAL):
+                cancelled = await self._execute_order_cancel_and_process_update(order=order)
             if cancelled:
                 return order.client_order_id
         except asyncio.CancelledError:
@@ -674,6 +700,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            self._connections_prewarm_task = safe_ensure_future(self._prewarm_connections())
 
     async def stop_network(self):
         """
@@ -719,6 +746,25 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._connections_prewarm_task is not None:
+            self._connections_prewarm_task.cancel()
+            self._connections_prewarm_task = None
+
+    async def _prewarm_connections(self):
+        """
+        Opens the number of connections to the exchange configured in the connection pool settings, sending that many
+        network check requests at once, so the first orders reuse open connections instead of waiting for the TCP
+        and TLS handshakes.
+        """
+        connections = get_default_connection_pool_settings().prewarm_connections
+        if connections > 0:
+            results = await safe_gather(
+                *[self._make_network_check_request() for _ in range(connections)], return_exceptions=True)
+            failed_requests = [result for result in results if isinstance(result, Exception)]
+            if failed_requests:
+                self.logger().debug(
+                    f"{len(failed_requests)} of {connections} connections could not be pre-warmed "
+                    f"({failed_requests[0]}).")
 
     # === loops and sync related methods ===
     #
@@ -729,7 +775,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -749,7 +796,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -777,7 +825,8 @@ class ExchangePyBase(ExchangeBase, ABC):
                 await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                with request_priority(RequestPriority.BACKGROUND):
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -816,7 +865,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.BACKGROUND):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -950,18 +1000,57 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        if len(orders) == 0:
+            return
+        try:
+            trade_updates = await self._request_all_trade_updates(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the trade updates of all orders, requesting them order by order. Error: {request_error}",
+                exc_info=request_error,
+            )
+            trade_updates = None
+
+        if trade_updates is not None:
+            self._process_batch_trade_updates(trade_updates=trade_updates, orders=orders)
+            return
+
+        semaphore = asyncio.Semaphore(self.ORDER_UPDATES_CONCURRENCY)
+
+        async def update_order_fills(order: InFlightOrder):
+            async with semaphore:
+                try:
+                    trade_updates = await self._all_trade_updates_for_order(order=order)
+                    for trade_update in trade_updates:
+                        self._order_tracker.process_trade_update(trade_update)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as request_error:
+                    self.logger().warning(
+                        f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                        exc_info=request_error,
+                    )
+
+        await safe_gather(*[update_order_fills(order) for order in orders])
+
+    def _process_batch_trade_updates(self, trade_updates: List[TradeUpdate], orders: List[InFlightOrder]):
+        """
+        Processes the trade updates returned by a bulk trades request. The bulk endpoints return trades of orders that
+        are not tracked and trades already processed, so only the new trades of the tracked orders are processed.
+        """
+        fillable_orders = self._order_tracker.all_fillable_orders
+        orders_by_exchange_order_id = {order.exchange_order_id: order for order in orders
+                                       if order.exchange_order_id is not None}
+        for trade_update in trade_updates:
+            order = (fillable_orders.get(trade_update.client_order_id)
+                     or orders_by_exchange_order_id.get(trade_update.exchange_order_id))
+            if order is None or trade_update.trade_id in order.order_fills:
+                continue
+            if trade_update.client_order_id != order.client_order_id:
+                trade_update = trade_update._replace(client_order_id=order.client_order_id)
+            self._order_tracker.process_trade_update(trade_update)
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -990,14 +1079,43 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
+        if len(orders) == 0:
+            return
+        try:
+            order_updates = await self._request_all_orders_status(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the status of all orders, requesting them order by order. Error: {request_error}",
+                exc_info=request_error,
+            )
+            order_updates = None
+
+        if order_updates is not None:
+            client_order_ids = {order.exchange_order_id: order.client_order_id for order in orders
+                                if order.exchange_order_id is not None}
+            updated_order_ids = set()
+            for order_update in order_updates:
                 self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                await error_handler(order, request_error)
+                updated_order_ids.add(order_update.client_order_id
+                                      or client_order_ids.get(order_update.exchange_order_id))
+            # Bulk endpoints usually return only the open orders, the status of the rest is requested order by order
+            orders = [order for order in orders if order.client_order_id not in updated_order_ids]
+
+        semaphore = asyncio.Semaphore(self.ORDER_UPDATES_CONCURRENCY)
+
+        async def update_order_status(order: InFlightOrder):
+            async with semaphore:
+                try:
+                    order_update = await self._request_order_status(tracked_order=order)
+                    self._order_tracker.process_order_update(order_update)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as request_error:
+                    await error_handler(order, request_error)
+
+        await safe_gather(*[update_order_status(order) for order in orders])
 
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
@@ -1049,6 +1167,28 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_all_trade_updates(self, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        """
+        Requests the trades of all the orders at once, for exchanges with a bulk endpoint (e.g. "my trades since id").
+        The trades of orders not in the list and the trades already processed are ignored.
+
+        :param orders: the orders to update
+        :return: the trade updates, or None if the exchange has no bulk endpoint and the trades are requested order by
+        order
+        """
+        return None
+
+    async def _request_all_orders_status(self, orders: List[InFlightOrder]) -> Optional[List[OrderUpdate]]:
+        """
+        Requests the status of all the orders at once, for exchanges with a bulk endpoint (e.g. "all open orders").
+        The status of the orders without an update in the result is requested order by order.
+
+        :param orders: the orders to update
+        :return: the order updates, or None if the exchange has no bulk endpoint and the status is requested order by
+        order
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1068,6 +1208,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _create_order_book(self) -> OrderBook:
+        """
+        Creates the local order book instance for each trading pair. Connectors can override it to use a different
+        order book backend (i.e. LadderOrderBook for markets with deep, tick-size quantized books).
+        """
+        return OrderBook()
+
     async def _initialize_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
@@ -0,0 +1,87 @@
+import csv
+import json
+import os
+from datetime import datetime, timezone
+from typing import IO, Any, Dict, List, Optional
+
+MARKET_DATA_FIELDS = ("timestamp", "exchange", "trading_pair", "mid_price", "best_bid", "best_ask", "order_book")
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def day_start_timestamp(timestamp: float) -> float:
+    """
+    Returns the timestamp (in seconds) of the start of the UTC day of the timestamp
+    """
+    return timestamp - timestamp % SECONDS_PER_DAY
+
+
+class MarketDataFileSink:
+    """
+    Append-only market data storage with one CSV file per UTC day (market_data_YYYY-MM-DD.csv).
+    The file of the current day is kept open and every batch of samples is appended and flushed at once. The order
+    books are stored as JSON, with the same format as the MarketData table.
+    """
+
+    FILE_PREFIX = "market_data_"
+
+    def __init__(self, directory: str, retention_days: int = 0):
+        """
+        :param directory: folder of the daily files, created if it does not exist
+        :param retention_days: number of days kept, including the current one (0 keeps all the files)
+        """
+        self._directory: str = directory
+        self._retention_days: int = retention_days
+        self._file: Optional[IO] = None
+        self._writer: Optional[Any] = None
+        self._file_day: Optional[str] = None
+
+    @property
+    def current_file_path(self) -> Optional[str]:
+        return self._file.name if self._file is not None else None
+
+    def file_path(self, day: str) -> str:
+        return os.path.join(self._directory, f"{self.FILE_PREFIX}{day}.csv")
+
+    def write(self, rows: List[Dict[str, Any]]):
+        """
+        Appends market data samples, with the same fields as MarketData (timestamps in milliseconds)
+        """
+        if not rows:
+            return
+        day = datetime.fromtimestamp(rows[0]["timestamp"] * 1e-3, tz=timezone.utc).strftime("%Y-%m-%d")
+        if day != self._file_day:
+            self._open(day)
+        self._writer.writerows([row["timestamp"], row["exchange"], row["trading_pair"], row["mid_price"],
+                                row["best_bid"], row["best_ask"], json.dumps(row["order_book"])] for row in rows)
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._writer = None
+        self._file_day = None
+
+    def _open(self, day: str):
+        self.close()
+        os.makedirs(self._directory, exist_ok=True)
+        path = self.file_path(day)
+        new_file = not os.path.exists(path)
+        self._file = open(path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        self._file_day = day
+        if new_file:
+            self._writer.writerow(MARKET_DATA_FIELDS)
+        self._remove_expired_files(day)
+
+    def _remove_expired_files(self, current_day: str):
+        if self._retention_days <= 0:
+            return
+        current = datetime.strptime(current_day, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp()
+        oldest_day = datetime.fromtimestamp(current - (self._retention_days - 1) * SECONDS_PER_DAY,
+                                            tz=timezone.utc).strftime("%Y-%m-%d")
+        for file_name in os.listdir(self._directory):
+            if file_name.startswith(self.FILE_PREFIX) and file_name.endswith(".csv"):
+                # ISO dates sort the same as the days they represent
+                if file_name[len(self.FILE_PREFIX):-len(".csv")] < oldest_day:
+                    os.remove(os.path.join(self._directory, file_name))
@@ -5,15 +5,17 @@ import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-import pandas as pd
+import numpy as np
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap, MarketDataCollectionSinkEnum
+from hummingbot.client.performance import PerformanceAccumulator
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.market_data_file_sink import SECONDS_PER_DAY, MarketDataFileSink, day_start_timestamp
+from hummingbot.connector.trades_csv_writer import TradesCsvWriter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
@@ -45,12 +47,16 @@ from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue, WriteBehindQueueStats, WriteJob
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_summary import TradeFillSummary
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
 class MarketsRecorder:
+    TRADES_CSV_FLUSH_INTERVAL = 5.0
+
     _logger = None
     _shared_instance: "MarketsRecorder" = None
     market_event_tag_map: Dict[int, MarketEvent] = {
@@ -75,7 +81,16 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind: bool = False,
+                 performance_start_timestamp: Optional[int] = None):
+        """
+        :param write_behind: if True the events are recorded by a writer thread in batched transactions while the
+            recorder is started, instead of writing to the database in the event callbacks
+        :param performance_start_timestamp: if set (in milliseconds), the recorder keeps the running totals of the
+            trade fills since that time by market and trading pair, and the totals of all the fills of the config file,
+            stored in the TradeFillSummary table
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -86,6 +101,18 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._db_maintenance_task: Optional[asyncio.Task] = None
+        self._market_data_file_sink: Optional[MarketDataFileSink] = None
+        self._market_data_cleanup_day: Optional[float] = None
+        self._trades_csv_writers: Dict[str, TradesCsvWriter] = {}
+        self._trades_csv_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._write_behind_queue: Optional[SQLWriteBehindQueue] = SQLWriteBehindQueue(sql) if write_behind else None
+        self._performance_start_timestamp: Optional[int] = performance_start_timestamp
+        self._performance_accumulators: Optional[Dict[Tuple[str, str], PerformanceAccumulator]] = None
+        self._total_performance_accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        self._total_performance_start_timestamps: Dict[Tuple[str, str], int] = {}
+        if performance_start_timestamp is not None:
+            self._load_performance_accumulators()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -127,34 +154,17 @@ class MarketsRecorder:
         MarketsRecorder._shared_instance = self
 
     def _start_market_data_recording(self):
+        if self._market_data_collection_config.market_data_collection_sink == MarketDataCollectionSinkEnum.file:
+            self._market_data_file_sink = MarketDataFileSink(
+                directory=os.path.join(data_path(), "market_data"),
+                retention_days=self._market_data_collection_config.market_data_retention_days)
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
     async def _record_market_data(self):
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    self._collect_market_data()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -162,6 +172,59 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _collect_market_data(self):
+        """
+        Samples the prices and the order book top levels of every trading pair and stores them all at once, with a
+        bulk insert in the MarketData table or appended to the daily market data file.
+        """
+        timestamp: int = self.db_timestamp
+        depth: int = self._market_data_collection_config.market_data_collection_depth + 1
+        rows: List[Dict[str, Any]] = []
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                bids, asks = market.get_order_book(trading_pair).get_snapshot_arrays(depth=depth)
+                rows.append({
+                    "timestamp": timestamp,
+                    "exchange": exchange,
+                    "trading_pair": trading_pair,
+                    "mid_price": market.get_price_by_type(trading_pair, PriceType.MidPrice),
+                    "best_bid": market.get_price_by_type(trading_pair, PriceType.BestBid),
+                    "best_ask": market.get_price_by_type(trading_pair, PriceType.BestAsk),
+                    "order_book": {"bid": self._order_book_levels(bids), "ask": self._order_book_levels(asks)},
+                })
+
+        if self._market_data_file_sink is not None:
+            self._market_data_file_sink.write(rows)
+        elif rows:
+            self._write(lambda session: session.execute(MarketData.__table__.insert(), rows))
+            self._remove_expired_market_data(timestamp)
+
+    @staticmethod
+    def _order_book_levels(levels: np.ndarray) -> List[List[float]]:
+        # Same [price, amount, update_id] rows as the order book entries
+        return [list(level) for level in zip(levels[:, 0].tolist(),
+                                             levels[:, 1].tolist(),
+                                             levels[:, 2].astype(np.int64).tolist())]
+
+    def _remove_expired_market_data(self, timestamp: int):
+        retention_days = self._market_data_collection_config.market_data_retention_days
+        day_start = day_start_timestamp(timestamp * 1e-3)
+        if retention_days <= 0 or day_start == self._market_data_cleanup_day:
+            return
+        self._market_data_cleanup_day = day_start
+        oldest_timestamp = int((day_start - (retention_days - 1) * SECONDS_PER_DAY) * 1e3)
+        self._write(lambda session: session.query(MarketData).filter(
+            MarketData.timestamp < oldest_timestamp).delete(synchronize_session=False))
+
+    async def _run_db_maintenance(self):
+        while True:
+            await self._sleep(self._sql_manager.maintenance_interval * 60 * 60)
+            try:
+                self._write(self._sql_manager.run_maintenance)
+            except Exception:
+                self.logger().error("Unexpected error while running the database maintenance.", exc_info=True)
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -178,12 +241,27 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def performance_start_timestamp(self) -> Optional[int]:
+        return self._performance_start_timestamp
+
+    @property
+    def write_behind_stats(self) -> Optional[WriteBehindQueueStats]:
+        """
+        Returns the queue depth and flush latency counters of the writer thread (None if write behind is disabled)
+        """
+        return self._write_behind_queue.stats if self._write_behind_queue is not None else None
+
     def start(self):
+        if self._write_behind_queue is not None:
+            self._write_behind_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_config.market_data_collection_enabled:
             self._start_market_data_recording()
+        if self._sql_manager.maintenance_interval > 0:
+            self._db_maintenance_task = self._ev_loop.create_task(self._run_db_maintenance())
 
     def stop(self):
         for market in self._markets:
@@ -191,6 +269,91 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._db_maintenance_task is not None:
+            self._db_maintenance_task.cancel()
+            self._db_maintenance_task = None
+        if self._market_data_file_sink is not None:
+            self._market_data_file_sink.close()
+            self._market_data_file_sink = None
+        if self._trades_csv_flush_handle is not None:
+            self._trades_csv_flush_handle.cancel()
+            self._trades_csv_flush_handle = None
+        for writer in self._trades_csv_writers.values():
+            writer.close()
+        self._trades_csv_writers.clear()
+        if self._write_behind_queue is not None:
+            # Writes all the events recorded before stopping
+            self._write_behind_queue.stop()
+
+    def flush_pending_writes(self):
+        """
+        Waits until the events recorded so far are written to the database, so they can be read back from it
+        """
+        if self._write_behind_queue is not None and self._write_behind_queue.started:
+            self._write_behind_queue.flush()
+
+    def _write(self, job: WriteJob):
+        """
+        Runs the write job in its own transaction, or hands it to the writer thread when write behind is running.
+        """
+        if self._write_behind_queue is not None and self._write_behind_queue.started:
+            self._write_behind_queue.enqueue(job)
+        else:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    job(session)
+
+    def get_performance_accumulators(
+            self,
+            start_timestamp: Optional[int] = None) -> Optional[Dict[Tuple[str, str], PerformanceAccumulator]]:
+        """
+        Returns the running totals of the trade fills since the start timestamp (in milliseconds, the performance start
+        timestamp by default) by market and trading pair. The totals are kept since the performance start timestamp and
+        for all the fills of the config file, so None is returned if the start timestamp is between the first fill and
+        the performance start timestamp (and if the recorder was created without a performance start timestamp)
+        """
+        if self._performance_accumulators is None:
+            return None
+        if start_timestamp is None or start_timestamp == self._performance_start_timestamp:
+            return dict(self._performance_accumulators)
+        if start_timestamp <= min(self._total_performance_start_timestamps.values(), default=start_timestamp):
+            return dict(self._total_performance_accumulators)
+        return None
+
+    def _load_performance_accumulators(self):
+        scale = TradeFill.price_amount_scale()
+        with self._sql_manager.get_new_session() as session:
+            # The summaries are sorted by last timestamp, so the latest one of each market is kept
+            summaries: Dict[Tuple[str, str], TradeFillSummary] = {
+                (summary.market, summary.symbol): summary
+                for summary in TradeFillSummary.get_summaries(session, self._config_file_path)
+            }
+            recorded_markets = (session
+                                .query(TradeFill.market, TradeFill.symbol)
+                                .filter(TradeFill.config_file_path == self._config_file_path)
+                                .distinct()
+                                .all())
+            # Only the fills after the stored totals are loaded, unless a market has fills but no stored totals
+            trades_start = 0
+            if len(summaries) > 0 and all((market, symbol) in summaries for market, symbol in recorded_markets):
+                trades_start = min(min(summary.last_timestamp for summary in summaries.values()) + 1,
+                                   self._performance_start_timestamp)
+            trades = TradeFill.get_trades_frame(session, trades_start, self._config_file_path)
+
+        for market_key, summary in summaries.items():
+            self._total_performance_accumulators[market_key] = PerformanceAccumulator.from_json(summary.metrics)
+            self._total_performance_start_timestamps[market_key] = summary.start_timestamp
+        for (market, symbol), market_trades in trades.groupby(["market", "symbol"], sort=False):
+            if (market, symbol) in summaries:
+                market_trades = market_trades[market_trades["timestamp"] > summaries[(market, symbol)].last_timestamp]
+            if len(market_trades) == 0:
+                continue
+            self._total_performance_start_timestamps.setdefault((market, symbol), int(market_trades["timestamp"].iloc[0]))
+            self._total_performance_accumulators.setdefault(
+                (market, symbol), PerformanceAccumulator(trading_pair=symbol)
+            ).add_accumulator(PerformanceAccumulator.from_trades_frame(symbol, market_trades, scale))
+        self._performance_accumulators = PerformanceAccumulator.from_trades_frame_by_market(
+            trades[trades["timestamp"] >= self._performance_start_timestamp], scale)
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -262,17 +425,32 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states(config_file_path=config_file_path,
+                                 market_name=market.display_name,
+                                 tracking_states=market.tracking_states,
+                                 timestamp=self.db_timestamp,
+                                 session=session)
+
+    @staticmethod
+    def _save_market_states(config_file_path: str,
+                            market_name: str,
+                            tracking_states: Dict[str, Any],
+                            timestamp: int,
+                            session: Session):
+        query: Query = (session
+                        .query(MarketState)
+                        .filter(MarketState.config_file_path == config_file_path,
+                                MarketState.market == market_name))
+        market_states: Optional[MarketState] = query.one_or_none()
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -304,32 +482,38 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        config_file_path: str = self._config_file_path
+        strategy_name: str = self._strategy_name
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = market.tracking_states
+        states_timestamp: int = self.db_timestamp
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write_order(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=config_file_path,
+                                        strategy=strategy_name,
+                                        market=market_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+            self._save_market_states(config_file_path, market_name, tracking_states, states_timestamp, session)
+
+        self._write(write_order)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -343,57 +527,83 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        config_file_path: str = self._config_file_path
+        strategy_name: str = self._strategy_name
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = market.tracking_states
+        states_timestamp: int = self.db_timestamp
+
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fee_json: Dict[str, Any] = evt.trade_fee.to_json()
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        position: str = evt.position if evt.position else PositionAction.NIL.value
+        summary: Optional[TradeFillSummary] = None
+        if self._performance_accumulators is not None:
+            market_key: Tuple[str, str] = (market_name, evt.trading_pair)
+            for accumulators in [self._performance_accumulators, self._total_performance_accumulators]:
+                accumulator: PerformanceAccumulator = accumulators.setdefault(
+                    market_key, PerformanceAccumulator(trading_pair=evt.trading_pair))
+                accumulator.add_fill(evt.trade_type.name, evt.price, evt.amount, trade_fee_json, position)
+            total_accumulator: PerformanceAccumulator = self._total_performance_accumulators[market_key]
+            summary = TradeFillSummary(config_file_path=config_file_path,
+                                       market=market_name,
+                                       symbol=evt.trading_pair,
+                                       start_timestamp=self._total_performance_start_timestamps.setdefault(
+                                           market_key, timestamp),
+                                       last_timestamp=timestamp,
+                                       num_trades=total_accumulator.num_trades,
+                                       metrics=total_accumulator.to_json())
+
+        def write_fill(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=config_file_path,
+                strategy=strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=evt.price,
+                amount=evt.amount,
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=trade_fee_json,
+                trade_fee_in_quote=fee_in_quote,
+                exchange_trade_id=evt.exchange_trade_id,
+                position=position,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            if summary is not None:
+                session.merge(summary)
+            self._save_market_states(config_file_path, market_name, tracking_states, states_timestamp, session)
+
+        self._write(write_fill)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -404,25 +614,23 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        config_file_path: str = self._config_file_path
+        market_name: str = market.display_name
+
+        def write_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._write(write_funding_payment)
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
@@ -433,19 +641,27 @@ class MarketsRecorder:
 
         # adding extra field "age"
         # // indicates order is a paper order so 'n/a'. For real orders, calculate age.
-        age = pd.Timestamp(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)), unit='s').strftime(
-            '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
+        age = time.strftime(
+            "%H:%M:%S",
+            time.gmtime(int((trade.timestamp * 1e-3) - (trade.order.creation_timestamp * 1e-3)))
+        ) if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        writer = self._trades_csv_writers.get(csv_path)
+        if writer is None:
+            writer = TradesCsvWriter(file_path=csv_path, field_names=field_names)
+            self._trades_csv_writers[csv_path] = writer
+        writer.write(field_data)
+        if writer.pending_rows_count > 0 and self._trades_csv_flush_handle is None:
+            # The rows of a batch that is not complete are written after a while anyway
+            self._trades_csv_flush_handle = self._ev_loop.call_later(self.TRADES_CSV_FLUSH_INTERVAL,
+                                                                     self._flush_trades_csv)
+
+    def _flush_trades_csv(self):
+        self._trades_csv_flush_handle = None
+        for writer in self._trades_csv_writers.values():
+            writer.flush()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -462,19 +678,23 @@ class MarketsRecorder:
         timestamp: int = self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
+        config_file_path: str = self._config_file_path
+        market_name: str = market.display_name
+        tracking_states: Dict[str, Any] = market.tracking_states
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                self._save_market_states(config_file_path, market_name, tracking_states, timestamp, session)
+
+        self._write(write_order_status)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -509,16 +729,21 @@ class MarketsRecorder:
             return
 
         timestamp: int = self.db_timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        config_file_path: str = self._config_file_path
+        connector_name: str = connector.display_name
+        tracking_states: Dict[str, Any] = connector.tracking_states
+        trade_fee_json: Dict[str, Any] = evt.trade_fee.to_json()
+
+        def write_range_position_update(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=trade_fee_json)
+            session.add(rp_update)
+            self._save_market_states(config_file_path, connector_name, tracking_states, timestamp, session)
+
+        self._write(write_range_position_update)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -528,17 +753,24 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        config_file_path: str = self._config_file_path
+        strategy_name: str = self._strategy_name
+        connector_name: str = connector.display_name
+        tracking_states: Dict[str, Any] = connector.tracking_states
+        states_timestamp: int = self.db_timestamp
+
+        def write_collected_fees(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=config_file_path,
+                                                                             strategy=strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+            self._save_market_states(config_file_path, connector_name, tracking_states, states_timestamp, session)
+
+        self._write(write_collected_fees)
 
     @staticmethod
     async def _sleep(delay):
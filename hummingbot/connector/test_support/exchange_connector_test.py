@@ -11,11 +11,12 @@ from aioresponses import aioresponses
 from aioresponses.core import RequestCall
 from bidict import bidict
 
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
-from hummingbot.core.data_type.trade_fee import TradeFeeBase
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TradeFeeBase
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -27,6 +28,10 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionPoolSettings,
+    set_default_connection_pool_settings,
+)
 
 
 class AbstractExchangeConnectorTests:
@@ -1540,6 +1545,74 @@ class AbstractExchangeConnectorTests:
                 )
             )
 
+        def test_update_orders_status_with_bulk_request_only_requests_missing_orders(self):
+            self.exchange._set_current_timestamp(1640780000)
+            for i in range(1, 4):
+                self.exchange.start_tracking_order(
+                    order_id=self.client_order_id_prefix + str(i),
+                    exchange_order_id=str(self.expected_exchange_order_id) + str(i),
+                    trading_pair=self.trading_pair,
+                    order_type=OrderType.LIMIT,
+                    trade_type=TradeType.BUY,
+                    price=Decimal("10000"),
+                    amount=Decimal("1"),
+                )
+            orders = list(self.exchange.in_flight_orders.values())
+            open_orders_updates = [
+                OrderUpdate(trading_pair=self.trading_pair, update_timestamp=1640780000, new_state=OrderState.OPEN,
+                            client_order_id=orders[0].client_order_id),
+                OrderUpdate(trading_pair=self.trading_pair, update_timestamp=1640780000, new_state=OrderState.OPEN,
+                            exchange_order_id=orders[1].exchange_order_id),
+            ]
+            order_status_mock = AsyncMock(side_effect=lambda tracked_order: OrderUpdate(
+                trading_pair=self.trading_pair, update_timestamp=1640780000, new_state=OrderState.OPEN,
+                client_order_id=tracked_order.client_order_id))
+
+            with patch.object(self.exchange, "_request_all_orders_status", AsyncMock(return_value=open_orders_updates)):
+                with patch.object(self.exchange, "_request_order_status", order_status_mock):
+                    self.async_run_with_timeout(ExchangePyBase._update_orders_with_error_handler(
+                        self.exchange, orders=orders, error_handler=AsyncMock()))
+
+            order_status_mock.assert_called_once_with(tracked_order=orders[2])
+
+        def test_update_orders_fills_with_bulk_request_skips_processed_trades(self):
+            self.exchange._set_current_timestamp(1640780000)
+            self.exchange.start_tracking_order(
+                order_id=self.client_order_id_prefix + "1",
+                exchange_order_id=str(self.expected_exchange_order_id),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+            order: InFlightOrder = self.exchange.in_flight_orders[self.client_order_id_prefix + "1"]
+            trade_updates = [
+                TradeUpdate(trade_id=str(trade_id), client_order_id=None, exchange_order_id=order.exchange_order_id,
+                            trading_pair=self.trading_pair, fill_timestamp=1640780000, fill_price=Decimal("10000"),
+                            fill_base_amount=Decimal("0.1"), fill_quote_amount=Decimal("1000"),
+                            fee=AddedToCostTradeFee(flat_fees=[]))
+                for trade_id in [1, 2, 1]]
+            trades_mock = AsyncMock()
+
+            with patch.object(self.exchange, "_request_all_trade_updates", AsyncMock(return_value=trade_updates)):
+                with patch.object(self.exchange, "_all_trade_updates_for_order", trades_mock):
+                    self.async_run_with_timeout(ExchangePyBase._update_orders_fills(self.exchange, orders=[order]))
+
+            trades_mock.assert_not_called()
+            self.assertEqual(Decimal("0.2"), order.executed_amount_base)
+            self.assertEqual({"1", "2"}, set(order.order_fills.keys()))
+
+        def test_prewarm_connections_sends_one_network_check_request_per_connection(self):
+            set_default_connection_pool_settings(ConnectionPoolSettings(prewarm_connections=3))
+            self.addCleanup(set_default_connection_pool_settings, None)
+            network_check_mock = AsyncMock(side_effect=[None, IOError("Connection refused"), None])
+
+            with patch.object(self.exchange, "_make_network_check_request", network_check_mock):
+                self.async_run_with_timeout(ExchangePyBase._prewarm_connections(self.exchange))
+
+            self.assertEqual(3, network_check_mock.call_count)
+
         @aioresponses()
         def test_lost_order_included_in_order_fills_update_and_not_in_order_status_update(self, mock_api):
             self.exchange._set_current_timestamp(1640780000)
@@ -64,7 +64,7 @@ class NetworkMockingAssistant:
     def _get_next_api_response_status(self, http_mock):
         return self._response_status_queues[http_mock].popleft()
 
-    async def _get_next_api_response_json(self, http_mock):
+    async def _get_next_api_response_json(self, http_mock, *args, **kwargs):
         ret = await self._response_json_queues[http_mock].get()
         return ret
 
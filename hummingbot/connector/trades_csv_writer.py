@@ -0,0 +1,102 @@
+import csv
+import os
+import time
+from datetime import datetime, timezone
+from shutil import move
+from typing import IO, Any, List, Optional, Sequence, Tuple
+
+
+class TradesCsvWriter:
+    """
+    Append-only CSV export of the trades of one config file.
+
+    The file is opened once and kept open. Its header is checked when it is opened (only the first line is read),
+    and a file with a different header is moved away as in previous versions. Rows are buffered and written in
+    batches, when flush_batch_size rows are pending or when flush is called.
+    The file is rotated (moved to <name>_<YYYYmmdd-HHMMSS>.csv) when it grows over max_file_size bytes or when the UTC
+    day changes.
+    """
+
+    def __init__(self,
+                 file_path: str,
+                 field_names: Sequence[str],
+                 flush_batch_size: int = 100,
+                 max_file_size: int = 100 * 1024 * 1024,
+                 rotate_daily: bool = True):
+        self._file_path: str = file_path
+        self._field_names: Tuple[str, ...] = tuple(field_names)
+        self._flush_batch_size: int = flush_batch_size
+        self._max_file_size: int = max_file_size
+        self._rotate_daily: bool = rotate_daily
+        self._pending_rows: List[Sequence[Any]] = []
+        self._file: Optional[IO] = None
+        self._writer: Optional[Any] = None
+        self._file_day: Optional[str] = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def pending_rows_count(self) -> int:
+        return len(self._pending_rows)
+
+    def write(self, row: Sequence[Any]):
+        self._pending_rows.append(row)
+        if len(self._pending_rows) >= self._flush_batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._pending_rows:
+            return
+        if self._file is None or self._rotation_needed():
+            self._open()
+        self._writer.writerows(self._pending_rows)
+        self._file.flush()
+        self._pending_rows = []
+
+    def close(self):
+        self.flush()
+        self._close_file()
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._writer = None
+        self._file_day = None
+
+    def _rotation_needed(self) -> bool:
+        return (self._file.tell() >= self._max_file_size
+                or (self._rotate_daily and self._utc_day(time.time()) != self._file_day))
+
+    def _open(self):
+        if self._file is not None:
+            self._close_file()
+            self._archive("")
+        elif os.path.exists(self._file_path):
+            if self._read_header() != self._field_names:
+                self._archive("_old")
+            elif self._rotate_daily and self._utc_day(os.path.getmtime(self._file_path)) != self._utc_day(time.time()):
+                self._archive("")
+            elif os.path.getsize(self._file_path) >= self._max_file_size:
+                self._archive("")
+
+        new_file = not os.path.exists(self._file_path)
+        self._file = open(self._file_path, mode="a", newline="")
+        self._writer = csv.writer(self._file)
+        self._file_day = self._utc_day(time.time())
+        if new_file:
+            self._writer.writerow(self._field_names)
+
+    def _read_header(self) -> Tuple[str, ...]:
+        with open(self._file_path, newline="") as file:
+            return tuple(next(csv.reader(file), ()))
+
+    def _archive(self, suffix: str):
+        timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+        move(self._file_path, f"{self._file_path[:-4]}{suffix}_{timestamp}.csv")
+
+    @staticmethod
+    def _utc_day(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import (
     List,
     Optional,
@@ -13,6 +14,15 @@ RequestWeight = int     # Integer representing the request weight of the path ur
 Seconds = float
 
 
+class RequestPriority(IntEnum):
+    """
+    Priority classes of the throttled requests. Lower values are served first when requests wait for capacity.
+    """
+    CRITICAL = 0        # Order lifecycle requests (order creation and cancellation)
+    NORMAL = 1
+    BACKGROUND = 2      # Periodic polling (balances, order status, trading rules, fees)
+
+
 @dataclass
 class LinkedLimitWeightPair:
     limit_id: str
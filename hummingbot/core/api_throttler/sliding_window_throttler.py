@@ -0,0 +1,312 @@
+import asyncio
+import itertools
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import MAX_CAPACITY_REACHED_WARNING_INTERVAL
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+
+# Priority used by the requests that do not specify one, set with the request_priority context manager
+_current_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "request_priority", default=RequestPriority.NORMAL)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the priority of the throttled requests executed within the context (including the tasks created in it).
+    (i.e)
+        with request_priority(RequestPriority.BACKGROUND):
+            await self._update_balances()
+    """
+    token = _current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_request_priority.reset(token)
+
+
+class WaitTimeHistogram:
+    """
+    Distribution of the time the requests waited for capacity. Each bucket counts the waits up to its upper bound
+    (in seconds) and greater than the previous bound.
+    """
+
+    BUCKETS: Tuple[float, ...] = (0.001, 0.01, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+    def __init__(self):
+        self.counts: List[int] = [0] * len(self.BUCKETS)
+        self.count: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.count if self.count > 0 else 0.0
+
+    def observe(self, wait_time: float):
+        self.counts[bisect_left(self.BUCKETS, wait_time)] += 1
+        self.count += 1
+        self.total_wait += wait_time
+        self.max_wait = max(self.max_wait, wait_time)
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the capacity used in one RateLimit. The acquired weights are kept in arrival order together with
+    their running sum, so expiring old entries and checking the capacity are amortized O(1) operations.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float, critical_reserve_pct: float = 0.0):
+        self.used: int = 0
+        self.entries: Deque[Tuple[float, int]] = deque()
+        # Requests waiting for capacity in this window, by priority and then in arrival order
+        self.waiters: Deque["SlidingWindowRequestContext"] = deque()
+        self.update_limit(rate_limit=rate_limit,
+                          safety_margin_pct=safety_margin_pct,
+                          critical_reserve_pct=critical_reserve_pct)
+
+    def update_limit(self, rate_limit: RateLimit, safety_margin_pct: float, critical_reserve_pct: float = 0.0):
+        self.rate_limit: RateLimit = rate_limit
+        self.limit: int = int(rate_limit.limit)
+        # Entries are kept for an extra safety margin, same as in AsyncRequestContext
+        self.interval: float = rate_limit.time_interval * (1 + safety_margin_pct)
+        # Capacity only available for critical requests, always leaving at least one unit for the rest
+        self.critical_reserve: int = min(int(self.limit * critical_reserve_pct), self.limit - 1)
+
+    def enqueue(self, waiter: "SlidingWindowRequestContext"):
+        position = len(self.waiters)
+        while position > 0 and self.waiters[position - 1].order_key > waiter.order_key:
+            position -= 1
+        self.waiters.insert(position, waiter)
+
+    def expire(self, now: float):
+        entries = self.entries
+        while entries and now - entries[0][0] > self.interval:
+            self.used -= entries.popleft()[1]
+
+    def time_to_capacity(self, weight: int, now: float, priority: RequestPriority = RequestPriority.CRITICAL) -> float:
+        """
+        Returns the number of seconds until the window has capacity for the weight (0 if it has capacity now).
+        Non critical requests can not use the capacity reserved for critical ones.
+        A weight bigger than the available limit waits for the window to be empty.
+        """
+        self.expire(now)
+        limit = self.limit if priority == RequestPriority.CRITICAL else self.limit - self.critical_reserve
+        weight = min(weight, limit)
+        excess = self.used + weight - limit
+        if excess <= 0:
+            return 0.0
+        for timestamp, entry_weight in self.entries:
+            excess -= entry_weight
+            if excess <= 0:
+                return max(timestamp + self.interval - now, 0.0)
+        return 0.0
+
+    def add(self, weight: int, now: float):
+        self.entries.append((now, weight))
+        self.used += weight
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until all the windows associated to the request have
+    capacity for it.
+    Requests that find capacity (and nobody waiting before them) are registered immediately. Otherwise they queue in
+    the windows that are involved and the first request of the queues sleeps exactly until the capacity it needs
+    frees, so there is no polling.
+    Waiting requests are ordered by priority first and by arrival order then, so lower priority requests are deferred
+    when critical ones need the capacity.
+    """
+
+    def __init__(self,
+                 throttler: "SlidingWindowAsyncThrottler",
+                 rate_limit: Optional[RateLimit],
+                 windows: List[Tuple[RateLimitWindow, int]],
+                 priority: RequestPriority = RequestPriority.NORMAL):
+        self._throttler = throttler
+        self._rate_limit = rate_limit
+        self._windows = windows
+        self._priority = priority
+        self._turn_event: Optional[asyncio.Event] = None
+        self.order_key: Tuple[int, int] = (priority, 0)
+
+    @property
+    def priority(self) -> RequestPriority:
+        return self._priority
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if the task fits now in all the windows associated with it, without considering the queued requests.
+        :return: True if it is within capacity to add a new task
+        """
+        return self._time_to_capacity(self._throttler._time()) <= 0
+
+    async def acquire(self):
+        self.order_key = (self._priority, self._throttler._next_sequence())
+        if self._is_first_in_line() and self.within_capacity():
+            self._register()
+            return
+
+        start = self._throttler._time()
+        self._turn_event = asyncio.Event()
+        for window, _ in self._windows:
+            window.enqueue(self)
+        try:
+            while True:
+                if not self._is_first_in_line():
+                    self._turn_event.clear()
+                    await self._turn_event.wait()
+                    continue
+                delay = self._time_to_capacity(self._throttler._time())
+                if delay <= 0:
+                    self._register(wait_time=self._throttler._time() - start)
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            self._leave_queues()
+
+    def _time_to_capacity(self, now: float) -> float:
+        delay = 0.0
+        for window, weight in self._windows:
+            window_delay = window.time_to_capacity(weight, now, self._priority)
+            if window_delay > 0:
+                self._throttler._notify_capacity_reached(window, now)
+                delay = max(delay, window_delay)
+        return delay
+
+    def _is_first_in_line(self) -> bool:
+        return all(len(window.waiters) == 0
+                   or window.waiters[0] is self
+                   or window.waiters[0].order_key > self.order_key
+                   for window, _ in self._windows)
+
+    def _register(self, wait_time: float = 0.0):
+        now = self._throttler._time()
+        for window, weight in self._windows:
+            window.add(weight, now)
+        self._throttler.wait_time_histograms[self._priority].observe(wait_time)
+
+    def _leave_queues(self):
+        for window, _ in self._windows:
+            if self in window.waiters:
+                window.waiters.remove(self)
+            if window.waiters:
+                window.waiters[0]._turn_event.set()
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class SlidingWindowAsyncThrottler(AsyncThrottlerBase):
+    """
+    Throttler with the same limits semantics as AsyncThrottler (weights, linked limits, safety margin and limits
+    share percentage) but keeping one sliding window per limit id instead of a shared list of task logs.
+    Checking and registering a request only touches the windows of its own limits, and waiting requests are woken up
+    when the capacity they need is freed instead of polling every retry interval.
+    Requests are still served in arrival order within each limit and priority class.
+
+    Each request has a priority class (see RequestPriority), given when executing the task or taken from the
+    request_priority context. Waiting critical requests are served before the rest, and a percentage of every limit
+    can be reserved for them so that a burst of background requests can not use the whole capacity.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None,
+                 critical_reserve_pct: float = 0.0):
+        """
+        :param critical_reserve_pct: Percentage (0 to 1) of each limit that only critical requests can use
+        """
+        self._windows: Dict[str, RateLimitWindow] = {}
+        self._task_windows: Dict[str, List[Tuple[RateLimitWindow, int]]] = {}
+        self._safety_margin_pct: float = safety_margin_pct
+        self._critical_reserve_pct: float = critical_reserve_pct
+        self._last_max_cap_warning_ts: float = 0.0
+        self._sequence = itertools.count()
+        self._wait_time_histograms: Dict[RequestPriority, WaitTimeHistogram] = {
+            priority: WaitTimeHistogram() for priority in RequestPriority}
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage)
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # The capacity already used is kept for the limits that are still defined
+        windows: Dict[str, RateLimitWindow] = {}
+        for limit_id, rate_limit in self._id_to_limit_map.items():
+            window = self._windows.get(limit_id)
+            if window is None:
+                window = RateLimitWindow(rate_limit=rate_limit,
+                                         safety_margin_pct=self._safety_margin_pct or 0,
+                                         critical_reserve_pct=self._critical_reserve_pct)
+            else:
+                window.update_limit(rate_limit=rate_limit,
+                                    safety_margin_pct=self._safety_margin_pct or 0,
+                                    critical_reserve_pct=self._critical_reserve_pct)
+            windows[limit_id] = window
+        self._windows = windows
+        self._task_windows = {}
+
+    @property
+    def wait_time_histograms(self) -> Dict[RequestPriority, WaitTimeHistogram]:
+        """
+        Returns the distribution of the time waited for capacity by the requests of each priority class
+        """
+        return self._wait_time_histograms
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the request. Defaults to the priority of the current request_priority
+            context (RequestPriority.NORMAL if not set)
+        :return: An async context (used with async with syntax)
+        """
+        windows = self._task_windows.get(limit_id)
+        if windows is None:
+            windows = self._windows_for_limit(limit_id)
+            self._task_windows[limit_id] = windows
+        return SlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=self._id_to_limit_map.get(limit_id),
+            windows=windows,
+            priority=_current_request_priority.get() if priority is None else priority,
+        )
+
+    def _windows_for_limit(self, limit_id: str) -> List[Tuple[RateLimitWindow, int]]:
+        rate_limit, related_limits = self.get_related_limits(limit_id=limit_id)
+        weights: Dict[str, int] = {}
+        if rate_limit is not None:
+            for limit, weight in [(rate_limit, rate_limit.weight)] + related_limits:
+                weights[limit.limit_id] = weights.get(limit.limit_id, 0) + weight
+        return [(self._windows[window_limit_id], weight) for window_limit_id, weight in weights.items()]
+
+    def _notify_capacity_reached(self, window: RateLimitWindow, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            rate_limit = window.rate_limit
+            self.logger().notify(
+                f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per "
+                f"{rate_limit.time_interval}s) has almost reached. Limits used "
+                f"is {window.used} in the last {rate_limit.time_interval} seconds")
+            self._last_max_cap_warning_ts = now
+
+    def _next_sequence(self) -> int:
+        return next(self._sequence)
+
+    def _time(self) -> float:
+        return time.monotonic()
@@ -10,3 +10,12 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        bint _skip_idle_ticks
+        object _tick_stats
+        dict _iterator_tick_stats
+        object _wake_future
+        set _early_tick_iterators
+        bint _early_tick_all
+
+    cdef bint c_tick_iterators(self, list iterators, double timestamp)
+    cdef double c_next_backtest_tick(self, double timestamp)
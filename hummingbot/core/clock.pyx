@@ -1,18 +1,27 @@
 # distutils: language=c++
 
+from libc.math cimport INFINITY, ceil
+from libc.stdint cimport int64_t
+
 import asyncio
 import logging
 import time
-from typing import List
+from typing import Dict, Iterable, List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_tick_stats import ClockTickStats, IteratorTickStats
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
 
+def _resolve_wake_future(wake_future: asyncio.Future, woken_early: bool):
+    if not wake_future.done():
+        wake_future.set_result(woken_early)
+
+
 cdef class Clock:
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -21,21 +30,36 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 skip_idle_ticks: bool = False):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param skip_idle_ticks: (back testing mode only) when all the iterators advertise their next event timestamp
+        (see TimeIterator.next_event_timestamp), jump directly to the tick of the earliest one instead of ticking
+        every tick size. This is opt-in: the client's own iterators do not advertise events, and the strategy V2
+        back testing engine simulates the executors from the candles without a clock
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
+        self._skip_idle_ticks = skip_idle_ticks
         self._start_time = start_time if clock_mode is ClockMode.BACKTEST else (time.time() // tick_size) * tick_size
         self._end_time = end_time
         self._current_tick = self._start_time
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_stats = ClockTickStats()
+        self._iterator_tick_stats = {}
+        self._wake_future = None
+        self._early_tick_iterators = set()
+        self._early_tick_all = False
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +81,18 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def skip_idle_ticks(self) -> bool:
+        return self._skip_idle_ticks
+
+    @property
+    def tick_stats(self) -> ClockTickStats:
+        return self._tick_stats
+
+    @property
+    def iterator_tick_stats(self) -> Dict[TimeIterator, IteratorTickStats]:
+        return self._iterator_tick_stats
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +117,79 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._iterator_tick_stats.pop(iterator, None)
+        self._early_tick_iterators.discard(iterator)
+
+    def wake_up(self, iterators: Optional[Iterable[TimeIterator]] = None):
+        """
+        Requests an early tick (real time mode only), without waiting for the next tick size boundary. It is meant to
+        be called from event handlers (e.g. a change in the top of a watched order book).
+        The early tick is processed as soon as the current tick (if any) finishes, with the current time as timestamp.
+        The regular ticks schedule is not modified: a regular tick whose time passed during an early tick runs first.
+        :param iterators: the iterators to tick early, all the iterators if not specified
+        """
+        if iterators is None:
+            self._early_tick_all = True
+        else:
+            self._early_tick_iterators.update(iterators)
+        if self._wake_future is not None:
+            _resolve_wake_future(self._wake_future, True)
+
+    async def _wait_for_tick(self, delay: float) -> bool:
+        """
+        Sleeps until the next tick. Returns True if it was woken up early by wake_up()
+        """
+        if self._early_tick_all or len(self._early_tick_iterators) > 0:
+            return True
+        loop = asyncio.get_event_loop()
+        self._wake_future = loop.create_future()
+        timer_handle = loop.call_later(delay, _resolve_wake_future, self._wake_future, False)
+        try:
+            return await self._wake_future
+        finally:
+            timer_handle.cancel()
+            self._wake_future = None
+
+    def _pop_early_tick_iterators(self) -> List[TimeIterator]:
+        iterators = [iterator for iterator in self._current_context
+                     if self._early_tick_all or iterator in self._early_tick_iterators]
+        self._early_tick_all = False
+        self._early_tick_iterators.clear()
+        return iterators
+
+    cdef bint c_tick_iterators(self, list iterators, double timestamp):
+        """
+        Ticks the iterators in real time mode, recording the time spent by each one.
+        Returns False if an iterator asked to stop the clock.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double start
+            double iterator_start
+
+        start = time.perf_counter()
+        for ci in iterators:
+            child_iterator = ci
+            iterator_start = time.perf_counter()
+            try:
+                child_iterator.c_tick(timestamp)
+            except StopIteration:
+                self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                return False
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            finally:
+                iterator_stats = self._iterator_tick_stats.get(ci)
+                if iterator_stats is None:
+                    iterator_stats = self._iterator_tick_stats[ci] = IteratorTickStats()
+                iterator_stats.record(time.perf_counter() - iterator_start)
+
+        duration = time.perf_counter() - start
+        self._tick_stats.last_duration = duration
+        self._tick_stats.max_duration = max(self._tick_stats.max_duration, duration)
+        if duration > self._tick_size:
+            self._tick_stats.overruns += 1
+        return True
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +199,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double last_tick_time
+            int64_t missed_ticks
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -101,32 +212,70 @@ cdef class Clock:
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
 
+        last_tick_time = self._current_tick
+        next_tick_time = last_tick_time + self._tick_size
         try:
             while True:
                 now = time.time()
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                # Sleep until the next tick, or until an early tick is requested. The next tick is kept across early
+                # ticks, and it runs before the pending early ticks once its time is reached, so early ticks (or a
+                # wake up racing the timer) never replace a regular tick
+                if now < next_tick_time:
+                    if await self._wait_for_tick(next_tick_time - now) and time.time() < next_tick_time:
+                        self._current_tick = max(time.time(), self._current_tick)
+                        self._tick_stats.early_ticks += 1
+                        if not self.c_tick_iterators(self._pop_early_tick_iterators(), self._current_tick):
+                            return
+                        continue
+
+                # Boundaries between the last tick and this one were skipped because the last tick overran
+                missed_ticks = <int64_t>round((next_tick_time - last_tick_time) / self._tick_size) - 1
+                if missed_ticks > 0:
+                    self._tick_stats.missed_ticks += missed_ticks
+                last_tick_time = next_tick_time
                 self._current_tick = next_tick_time
+                self._tick_stats.ticks += 1
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                if not self.c_tick_iterators(self._current_context, self._current_tick):
+                    return
+                next_tick_time = max(((time.time() // self._tick_size) + 1) * self._tick_size,
+                                     last_tick_time + self._tick_size)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    cdef double c_next_backtest_tick(self, double timestamp):
+        """
+        Returns the next tick to process in back testing mode. Ticks can only be skipped if every iterator knows its
+        next event, and never beyond the first tick at or after the earliest event (or the end timestamp), so the
+        iterators observe the same changes of state, at the same tick timestamps, than when ticking every tick size.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double next_tick = self._current_tick + self._tick_size
+            double horizon = timestamp if timestamp == timestamp else INFINITY
+            double event_timestamp
+            int64_t skipped_ticks
+
+        for ci in self._child_iterators:
+            child_iterator = ci
+            event_timestamp = child_iterator.next_event_timestamp()
+            if event_timestamp != event_timestamp:
+                # An iterator without a known next event can change its state at any tick
+                return next_tick
+            horizon = min(horizon, event_timestamp)
+
+        if horizon <= next_tick or horizon == INFINITY:
+            return next_tick
+        skipped_ticks = <int64_t>ceil((horizon - self._current_tick) / self._tick_size) - 1
+        self._tick_stats.skipped_ticks += skipped_ticks
+        return self._current_tick + (skipped_ticks + 1) * self._tick_size
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
@@ -138,7 +287,11 @@ cdef class Clock:
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
+                if self._skip_idle_ticks:
+                    self._current_tick = self.c_next_backtest_tick(timestamp)
+                else:
+                    self._current_tick += self._tick_size
+                self._tick_stats.ticks += 1
                 for ci in self._child_iterators:
                     child_iterator = ci
                     try:
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class IteratorTickStats:
+    """
+    Time spent by one time iterator processing the clock ticks.
+    """
+    ticks: int = 0
+    total_duration: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        return self.total_duration / self.ticks if self.ticks > 0 else 0.0
+
+    def record(self, duration: float):
+        self.ticks += 1
+        self.total_duration += duration
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+
+
+@dataclass
+class ClockTickStats:
+    """
+    Clock counters.
+    ticks: ticks on tick size boundaries
+    early_ticks: ticks requested with Clock.wake_up before the next boundary (real time mode)
+    missed_ticks: boundaries skipped because the previous tick did not finish on time (real time mode)
+    overruns: ticks that took longer than the tick size to process (real time mode)
+    skipped_ticks: idle ticks skipped because no iterator had events on them (back testing mode)
+    """
+    ticks: int = 0
+    early_ticks: int = 0
+    missed_ticks: int = 0
+    overruns: int = 0
+    skipped_ticks: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
@@ -5,4 +5,6 @@ cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef Py_ssize_t c_copy_top_levels(self, bint is_bid, double[:, :] levels)
+    cdef c_build_depth_index(self)
     cdef double c_get_price(self, bint is_buy) except? -1
@@ -28,6 +28,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._version += 1
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +72,29 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self._version += 1
+
+    cdef Py_ssize_t c_copy_top_levels(self, bint is_bid, double[:, :] levels):
+        cdef:
+            Py_ssize_t index = 0
+
+        if levels.shape[0] == 0:
+            return 0
+        for entry in (self.bid_entries() if is_bid else self.ask_entries()):
+            levels[index, 0] = entry.price
+            levels[index, 1] = entry.amount
+            levels[index, 2] = entry.update_id
+            index += 1
+            if index == levels.shape[0]:
+                break
+        return index
+
+    cdef c_build_depth_index(self):
+        # The composite entries depend on the recorded filled orders, so the index is built from them
+        for bid_entry in self.bid_entries():
+            self.c_push_depth_level(True, bid_entry.price, bid_entry.amount)
+        for ask_entry in self.ask_entries():
+            self.c_push_depth_level(False, ask_entry.price, ask_entry.amount)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -0,0 +1,19 @@
+# distutils: language=c++
+
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+
+cdef class LadderOrderBook(OrderBook):
+    cdef vector[OrderBookEntry] _bid_levels
+    cdef vector[OrderBookEntry] _ask_levels
+
+    cdef c_apply_level(self, vector[OrderBookEntry] *levels, const OrderBookEntry &entry, bint descending)
+    cdef c_truncate_overlap_levels(self)
+    cdef c_update_best_prices(self)
+    cdef size_t c_levels_count(self, bint is_bid)
+    cdef Py_ssize_t c_copy_top_levels(self, bint is_bid, double[:, :] levels)
+    cdef c_build_depth_index(self)
+    cdef double c_get_price(self, bint is_buy) except? -1
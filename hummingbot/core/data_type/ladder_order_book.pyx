@@ -0,0 +1,194 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from typing import Iterator
+
+from cython.operator cimport address as ref, dereference as deref
+from libc.stdint cimport int64_t
+from libcpp.algorithm cimport sort
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+NaN = float("nan")
+
+
+cdef inline size_t c_level_position(vector[OrderBookEntry] *levels, double price, bint descending):
+    """
+    Binary search of the position where a level with the given price is (or would be inserted) in a ladder
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(levels).size()
+        size_t middle
+        double middle_price
+
+    while low < high:
+        middle = (low + high) >> 1
+        middle_price = deref(levels)[middle].getPrice()
+        if (middle_price > price) if descending else (middle_price < price):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline void c_remove_repeated_levels(vector[OrderBookEntry] *levels):
+    """
+    Keeps only one level per price in a sorted ladder
+    """
+    cdef:
+        size_t read_index
+        size_t write_index = 0
+
+    for read_index in range(deref(levels).size()):
+        if write_index > 0 and deref(levels)[write_index - 1].getPrice() == deref(levels)[read_index].getPrice():
+            continue
+        deref(levels)[write_index] = deref(levels)[read_index]
+        write_index += 1
+    deref(levels).resize(write_index)
+
+
+cdef class LadderOrderBook(OrderBook):
+    """
+    Order book backend that keeps each side as a contiguous, price sorted array of levels (a price ladder) instead of
+    a std::set. Diffs are located with a binary search and the top of the book is kept at the end of the arrays, so
+    the updates close to the best prices (the vast majority of them) only move a few entries, and rebuilding the depth
+    index used by the volume and VWAP queries reads sequential memory.
+
+    The Python and Cython API is the same as OrderBook's. Connectors select it by overriding
+    `ExchangePyBase._create_order_book`.
+    """
+
+    cdef c_apply_level(self, vector[OrderBookEntry] *levels, const OrderBookEntry &entry, bint descending):
+        cdef:
+            size_t position = c_level_position(levels, entry.getPrice(), descending)
+            bint found = position < deref(levels).size() and deref(levels)[position].getPrice() == entry.getPrice()
+
+        # Diffs with 0 amounts mean deletion.
+        if entry.getAmount() > 0:
+            if found:
+                deref(levels)[position] = entry
+            else:
+                deref(levels).insert(deref(levels).begin() + position, entry)
+        elif found:
+            deref(levels).erase(deref(levels).begin() + position)
+
+    cdef c_truncate_overlap_levels(self):
+        # Same rules as truncateOverlapEntries: centralised, newer entries win; dex, the bigger notional wins
+        cdef:
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+            bint remove_ask
+
+        while self._bid_levels.size() > 0 and self._ask_levels.size() > 0:
+            top_bid = self._bid_levels.back()
+            top_ask = self._ask_levels.back()
+            if top_bid.getPrice() < top_ask.getPrice():
+                break
+            if self._dex:
+                remove_ask = top_bid.getAmount() * top_bid.getPrice() > top_ask.getAmount() * top_ask.getPrice()
+            else:
+                remove_ask = top_bid.getUpdateId() > top_ask.getUpdateId()
+            if remove_ask:
+                self._ask_levels.pop_back()
+            else:
+                self._bid_levels.pop_back()
+
+    cdef c_update_best_prices(self):
+        # Record the current best prices, for faster c_get_price() calls.
+        if self._bid_levels.size() > 0:
+            self._best_bid = self._bid_levels.back().getPrice()
+        if self._ask_levels.size() > 0:
+            self._best_ask = self._ask_levels.back().getPrice()
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        # Bids are sorted ascending and asks descending, so the best prices of both sides are the last levels.
+        for bid in bids:
+            self.c_apply_level(ref(self._bid_levels), bid, False)
+        for ask in asks:
+            self.c_apply_level(ref(self._ask_levels), ask, True)
+
+        self.c_truncate_overlap_levels()
+        self.c_update_best_prices()
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+        self._version += 1
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            size_t index
+
+        self._bid_levels = bids
+        sort(self._bid_levels.begin(), self._bid_levels.end())
+        c_remove_repeated_levels(ref(self._bid_levels))
+
+        sort(asks.begin(), asks.end())
+        c_remove_repeated_levels(ref(asks))
+        self._ask_levels.clear()
+        self._ask_levels.reserve(asks.size())
+        index = asks.size()
+        while index > 0:
+            index -= 1
+            self._ask_levels.push_back(asks[index])
+
+        self._best_bid = self._best_ask = NaN
+        if self._dex:
+            self.c_truncate_overlap_levels()
+        self.c_update_best_prices()
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+        self._version += 1
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t index = self._bid_levels.size()
+            OrderBookEntry entry
+        while index > 0:
+            index -= 1
+            entry = self._bid_levels[index]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t index = self._ask_levels.size()
+            OrderBookEntry entry
+        while index > 0:
+            index -= 1
+            entry = self._ask_levels[index]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            vector[OrderBookEntry] *levels = ref(self._ask_levels) if is_buy else ref(self._bid_levels)
+        if deref(levels).size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
+
+    cdef size_t c_levels_count(self, bint is_bid):
+        return self._bid_levels.size() if is_bid else self._ask_levels.size()
+
+    cdef Py_ssize_t c_copy_top_levels(self, bint is_bid, double[:, :] levels):
+        cdef:
+            vector[OrderBookEntry] *side_levels = ref(self._bid_levels) if is_bid else ref(self._ask_levels)
+            size_t level_index = deref(side_levels).size()
+            Py_ssize_t index = 0
+
+        while index < levels.shape[0] and level_index > 0:
+            level_index -= 1
+            levels[index, 0] = deref(side_levels)[level_index].getPrice()
+            levels[index, 1] = deref(side_levels)[level_index].getAmount()
+            levels[index, 2] = deref(side_levels)[level_index].getUpdateId()
+            index += 1
+        return index
+
+    cdef c_build_depth_index(self):
+        cdef:
+            size_t index = self._bid_levels.size()
+        while index > 0:
+            index -= 1
+            self.c_push_depth_level(True, self._bid_levels[index].getPrice(), self._bid_levels[index].getAmount())
+        index = self._ask_levels.size()
+        while index > 0:
+            index -= 1
+            self.c_push_depth_level(False, self._ask_levels[index].getPrice(), self._ask_levels[index].getAmount())
@@ -6,7 +6,11 @@ from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
-cimport numpy as np
+
+
+cdef int64_t c_fill_entries_from_array(vector[OrderBookEntry] &entries,
+                                       const double[:, :] levels,
+                                       int64_t update_id) except? -1
 
 
 cdef class OrderBook(PubSub):
@@ -20,16 +24,34 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef int64_t _version
+    cdef int64_t _depth_index_version
+    cdef object _snapshot_cache
+    cdef int64_t _snapshot_cache_version
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_base
+    cdef vector[double] _bid_depth_quote
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_base
+    cdef vector[double] _ask_depth_quote
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             const double[:, :] bids_array,
+                             const double[:, :] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                const double[:, :] bids_array,
+                                const double[:, :] asks_array,
+                                int64_t update_id=*)
+    cdef object c_get_levels_array(self, bint is_bid, object depth)
+    cdef size_t c_levels_count(self, bint is_bid)
+    cdef Py_ssize_t c_copy_top_levels(self, bint is_bid, double[:, :] levels)
+    cdef c_build_depth_index(self)
+    cdef c_push_depth_level(self, bint is_bid, double price, double amount)
+    cdef c_ensure_depth_index(self)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -5,6 +5,7 @@ import logging
 import time
 from typing import (
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -30,12 +31,78 @@ from hummingbot.core.event.events import (
     OrderBookTradeEvent
 )
 
-cimport numpy as np
-
 ob_logger = None
 NaN = float("nan")
 
 
+cdef int64_t c_fill_entries_from_array(vector[OrderBookEntry] &entries,
+                                       const double[:, :] levels,
+                                       int64_t update_id) except? -1:
+    """
+    Appends one OrderBookEntry per row of a [price, amount] or [price, amount, update_id] array, reading the values
+    directly from the array buffer instead of creating intermediate Python objects.
+    Returns the highest update id found in the array (or update_id if the array has no update_id column).
+    """
+    cdef:
+        Py_ssize_t i
+        Py_ssize_t rows_count = levels.shape[0]
+        bint has_update_ids = levels.shape[1] > 2
+        int64_t entry_update_id = update_id
+        int64_t last_update_id = update_id
+
+    if rows_count > 0 and levels.shape[1] < 2:
+        raise ValueError(f"Order book levels must have at least 2 columns (price, amount), got {levels.shape[1]}.")
+
+    entries.reserve(entries.size() + rows_count)
+    for i in range(rows_count):
+        if has_update_ids:
+            entry_update_id = <int64_t>levels[i, 2]
+            if entry_update_id > last_update_id:
+                last_update_id = entry_update_id
+        entries.push_back(OrderBookEntry(levels[i, 0], levels[i, 1], entry_update_id))
+    return last_update_id
+
+
+cdef inline size_t c_first_index_reaching(vector[double] *cumulative_values, double target):
+    """
+    Binary search of the first level whose cumulative value is >= target. Returns the number of levels if the target
+    is never reached (also when target is NaN).
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(cumulative_values).size()
+        size_t middle
+
+    while low < high:
+        middle = (low + high) >> 1
+        if not (deref(cumulative_values)[middle] >= target):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline size_t c_levels_count_within_price(vector[double] *prices, double price, bint is_buy):
+    """
+    Number of levels from the top of the book with a price equal or better than the given price, that is, lower or
+    equal for asks (is_buy) and higher or equal for bids.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = deref(prices).size()
+        size_t middle
+        double middle_price
+
+    while low < high:
+        middle = (low + high) >> 1
+        middle_price = deref(prices)[middle]
+        if not ((middle_price > price) if is_buy else (middle_price < price)):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -55,6 +122,10 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._version = 0
+        self._depth_index_version = -1
+        self._snapshot_cache = None
+        self._snapshot_cache_version = -1
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -95,6 +166,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -135,6 +207,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -169,13 +242,73 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        Counter increased every time the content of the order book changes
+        """
+        return self._version
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
-        return bids_df, asks_df
+        """
+        The full order book as bids and asks DataFrames. The DataFrames are cached and only rebuilt after the order
+        book changes. Callers get copies of them, so changing the DataFrames returned doesn't change the cached ones.
+        """
+        if self._snapshot_cache_version != self._version:
+            bids_array, asks_array = self.get_snapshot_arrays()
+            bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+            asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
+            self._snapshot_cache = (bids_df, asks_df)
+            self._snapshot_cache_version = self._version
+        bids_df, asks_df = self._snapshot_cache
+        return bids_df.copy(), asks_df.copy()
+
+    def get_snapshot_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the top levels of each side as [price, amount, update_id] float64 arrays, best prices first.
+        :param depth: the number of levels to include per side, all the levels if None. Only the requested levels are
+        read from the order book.
+        """
+        return self.c_get_levels_array(True, depth), self.c_get_levels_array(False, depth)
+
+    cdef object c_get_levels_array(self, bint is_bid, object depth):
+        cdef:
+            size_t levels_count = self.c_levels_count(is_bid)
+            Py_ssize_t copied_levels_count
+
+        if depth is not None:
+            levels_count = min(levels_count, <size_t>max(depth, 0))
+        levels = np.empty((levels_count, 3), dtype=np.float64)
+        copied_levels_count = self.c_copy_top_levels(is_bid, levels)
+        return levels[:copied_levels_count]
+
+    cdef size_t c_levels_count(self, bint is_bid):
+        return self._bid_book.size() if is_bid else self._ask_book.size()
+
+    cdef Py_ssize_t c_copy_top_levels(self, bint is_bid, double[:, :] levels):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
+            Py_ssize_t index = 0
+
+        while index < levels.shape[0]:
+            if is_bid:
+                if bid_iterator == self._bid_book.rend():
+                    break
+                entry = deref(bid_iterator)
+                inc(bid_iterator)
+            else:
+                if ask_iterator == self._ask_book.end():
+                    break
+                entry = deref(ask_iterator)
+                inc(ask_iterator)
+            levels[index, 0] = entry.getPrice()
+            levels[index, 1] = entry.getAmount()
+            levels[index, 2] = entry.getUpdateId()
+            index += 1
+        return index
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
@@ -208,58 +341,52 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = 0):
         """
-        The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        The diffs arrays must have either 2 columns, [price, amount], or 3 columns, [price, amount, update_id].
+        All columns are of double type. For 2 column arrays all the entries get the update_id passed as parameter.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             const double[:, :] bids_array,
+                             const double[:, :] asks_array,
+                             int64_t update_id=0):
         """
-        The diffs data frame must have 3 columns, [price, amount, update_id].
+        The diffs arrays must have either 2 columns, [price, amount], or 3 columns, [price, amount, update_id].
         All columns are of double type.
         """
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t last_update_id = update_id
+
+        last_update_id = max(last_update_id, c_fill_entries_from_array(cpp_bids, bids_array, update_id))
+        last_update_id = max(last_update_id, c_fill_entries_from_array(cpp_asks, asks_array, update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: int = 0):
         """
-        The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        The snapshot arrays must have either 2 columns, [price, amount], or 3 columns, [price, amount, update_id].
+        All columns are of double type. For 2 column arrays all the entries get the update_id passed as parameter.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, update_id)
 
     cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                const double[:, :] bids_array,
+                                const double[:, :] asks_array,
+                                int64_t update_id=0):
         """
-        The diffs data frame must have 3 columns, [price, amount, update_id].
+        The snapshot arrays must have either 2 columns, [price, amount], or 3 columns, [price, amount, update_id].
         All columns are of double type.
         """
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t last_update_id = update_id
+
+        last_update_id = max(last_update_id, c_fill_entries_from_array(cpp_bids, bids_array, update_id))
+        last_update_id = max(last_update_id, c_fill_entries_from_array(cpp_asks, asks_array, update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -318,142 +445,179 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef c_build_depth_index(self):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
+
+        while bid_iterator != self._bid_book.rend():
+            entry = deref(bid_iterator)
+            self.c_push_depth_level(True, entry.getPrice(), entry.getAmount())
+            inc(bid_iterator)
+        while ask_iterator != self._ask_book.end():
+            entry = deref(ask_iterator)
+            self.c_push_depth_level(False, entry.getPrice(), entry.getAmount())
+            inc(ask_iterator)
+
+    cdef c_push_depth_level(self, bint is_bid, double price, double amount):
+        cdef:
+            vector[double] *prices = ref(self._bid_depth_prices) if is_bid else ref(self._ask_depth_prices)
+            vector[double] *cumulative_base = ref(self._bid_depth_base) if is_bid else ref(self._ask_depth_base)
+            vector[double] *cumulative_quote = ref(self._bid_depth_quote) if is_bid else ref(self._ask_depth_quote)
+            double previous_base = 0
+            double previous_quote = 0
+
+        if prices.size() > 0:
+            previous_base = cumulative_base.back()
+            previous_quote = cumulative_quote.back()
+        prices.push_back(price)
+        cumulative_base.push_back(previous_base + amount)
+        cumulative_quote.push_back(previous_quote + amount * price)
+
+    cdef c_ensure_depth_index(self):
+        """
+        Rebuilds (only if the book changed since the last build) the per side arrays with the level prices and the
+        cumulative base and quote amounts from the top of the book, used to answer the depth queries with binary
+        searches instead of walking the book.
+        """
+        if self._depth_index_version == self._version:
+            return
+        self._bid_depth_prices.clear()
+        self._bid_depth_base.clear()
+        self._bid_depth_quote.clear()
+        self._ask_depth_prices.clear()
+        self._ask_depth_base.clear()
+        self._ask_depth_quote.clear()
+        self.c_build_depth_index()
+        self._depth_index_version = self._version
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cumulative_base
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+        index = c_first_index_reaching(cumulative_base, volume)
+        if index < prices.size():
+            cumulative_volume = deref(cumulative_base)[index]
+            result_price = deref(prices)[index]
+        elif prices.size() > 0:
+            cumulative_volume = cumulative_base.back()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t index
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+        cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+        index = c_first_index_reaching(cumulative_base, volume)
+        if index < prices.size():
+            if index > 0:
+                total_cost = deref(cumulative_quote)[index - 1]
+                total_volume = deref(cumulative_base)[index - 1]
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(prices)[index]
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif prices.size() > 0:
+            total_volume = cumulative_base.back()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cumulative_quote
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+        index = c_first_index_reaching(cumulative_quote, quote_volume)
+        if index < prices.size():
+            cumulative_volume = deref(cumulative_quote)[index]
+            result_price = deref(prices)[index]
+        elif prices.size() > 0:
+            cumulative_volume = cumulative_quote.back()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices
+            vector[double] *cumulative_base
+            vector[double] *cumulative_quote
+            size_t index
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+        cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+        index = c_first_index_reaching(cumulative_base, base_amount)
+        if index < prices.size():
+            if index > 0:
+                cumulative_volume = deref(cumulative_quote)[index - 1]
+                cumulative_base_amount = deref(cumulative_base)[index - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[index]
+        elif prices.size() > 0:
+            cumulative_volume = cumulative_quote.back()
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cumulative_base
+            size_t levels_count
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cumulative_base = ref(self._ask_depth_base) if is_buy else ref(self._bid_depth_base)
+        levels_count = c_levels_count_within_price(prices, price, is_buy)
+        if levels_count > 0:
+            cumulative_volume = deref(cumulative_base)[levels_count - 1]
+            result_price = deref(prices)[levels_count - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cumulative_quote
+            size_t levels_count
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+        cumulative_quote = ref(self._ask_depth_quote) if is_buy else ref(self._bid_depth_quote)
+        levels_count = c_levels_count_within_price(prices, price, is_buy)
+        if levels_count > 0:
+            cumulative_volume = deref(cumulative_quote)[levels_count - 1]
+            result_price = deref(prices)[levels_count - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -475,9 +639,22 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: Iterable[float]) -> List[OrderBookQueryResult]:
+        """
+        Batched version of get_price_for_volume. The depth index is built at most once for all the volumes.
+        """
+        return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: Iterable[float]) -> List[OrderBookQueryResult]:
+        """
+        Batched version of get_vwap_for_volume. The depth index is built at most once for all the volumes.
+        """
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
-        replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        # Diffs with the same timestamp as the snapshot sort after it, so the ones already included are skipped
+        replay_diffs = [diff for diff in diffs[replay_position:] if diff.update_id > snapshot.update_id]
+        self.apply_numpy_snapshot(snapshot.bids_array, snapshot.asks_array, snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_numpy_diffs(diff.bids_array, diff.asks_array, diff.update_id)
@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -54,15 +56,33 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        return self._entries_to_rows(self.content["asks"])
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        return self._entries_to_rows(self.content["bids"])
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        """
+        The ask levels as a (price, amount) float64 array. If the data source already provided the levels as an
+        array it is returned as is, without copying it. Messages that override `asks` to parse their content get the
+        array built from their rows.
+        """
+        if type(self).asks is not OrderBookMessage.asks:
+            return order_book_rows_to_array(self.asks)
+        return order_book_entries_to_array(self.content["asks"])
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bid levels as a (price, amount) float64 array. If the data source already provided the levels as an
+        array it is returned as is, without copying it. Messages that override `bids` to parse their content get the
+        array built from their rows.
+        """
+        if type(self).bids is not OrderBookMessage.bids:
+            return order_book_rows_to_array(self.bids)
+        return order_book_entries_to_array(self.content["bids"])
 
     @property
     def has_update_id(self) -> bool:
@@ -72,6 +92,12 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def has_trade_id(self) -> bool:
         return self.type == OrderBookMessageType.TRADE
 
+    def _entries_to_rows(self, entries: Any) -> List[OrderBookRow]:
+        update_id = self.update_id
+        if isinstance(entries, np.ndarray):
+            entries = entries.tolist()
+        return [OrderBookRow(float(price), float(amount), update_id) for price, amount, *trash in entries]
+
     def __eq__(self, other: "OrderBookMessage") -> bool:
         eq = (
             (self.type == other.type)
@@ -95,3 +121,27 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+def order_book_entries_to_array(entries: Any) -> np.ndarray:
+    """
+    Converts the order book levels received from an exchange into a (price, amount) float64 array, the format
+    expected by `OrderBook.apply_numpy_diffs` and `OrderBook.apply_numpy_snapshot`.
+    :param entries: the levels, either as an array or as an iterable of (price, amount, ...) entries where price and
+    amount can be any value convertible to float (str, Decimal, float)
+    :return: an array with one row per level and two columns (price, amount)
+    """
+    if isinstance(entries, np.ndarray):
+        return entries
+    if len(entries) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.array([(price, amount) for price, amount, *trash in entries], dtype=np.float64)
+
+
+def order_book_rows_to_array(rows: List[OrderBookRow]) -> np.ndarray:
+    """
+    Converts order book rows into a (price, amount) float64 array, like `order_book_entries_to_array`.
+    """
+    if len(rows) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.array([(row.price, row.amount) for row in rows], dtype=np.float64)
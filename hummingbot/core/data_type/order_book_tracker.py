@@ -2,9 +2,11 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
@@ -12,7 +14,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +23,28 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookTrackingMetrics:
+    """
+    Per trading pair statistics of the diff messages processing in the order book tracker.
+    `lag` is the difference in seconds between the moment the last diff was applied and its exchange timestamp.
+    """
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_batch_size: int = 0
+    diffs_applied: int = 0
+    diffs_coalesced: int = 0
+    lag: float = 0.0
+    max_lag: float = 0.0
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Snapshot requests are rate limited by the connector's throttler, this only caps how many are in flight
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS: int = 10
+    ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL: float = 5.0
+    # The coalesced levels keep their update ids in a float64 column, exact only up to 2^53
+    MAX_COALESCED_UPDATE_ID: int = 2 ** 53
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +53,23 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(
+        self,
+        data_source: OrderBookTrackerDataSource,
+        trading_pairs: List[str],
+        domain: Optional[str] = None,
+        coalesce_diffs: bool = False,
+    ):
+        """
+        :param coalesce_diffs: if True, every time a pair's tracking task wakes up it drains all the pending messages
+        for the pair and merges consecutive diffs into a single net update before applying it to the order book
+        """
         self._domain: Optional[str] = domain
+        self._coalesce_diffs: bool = coalesce_diffs
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_books_ready: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +79,9 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._tracking_metrics: Dict[str, OrderBookTrackingMetrics] = defaultdict(OrderBookTrackingMetrics)
+        self._top_of_book_listeners: Dict[str, List[Callable[[str], None]]] = defaultdict(list)
+        self._top_of_book: Dict[str, Tuple] = {}
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +105,31 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order books are already initialized, even if the tracker is not fully ready yet
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._order_books_ready and self._order_books_ready[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        await self._order_books_ready[trading_pair].wait()
+
+    def add_top_of_book_listener(self, trading_pair: str, listener: Callable[[str], None]):
+        """
+        Registers a function to be called (with the trading pair as argument) every time the best bid or the best ask
+        (price or amount) of the trading pair order book changes. It can be used for example to wake up the clock
+        (`Clock.wake_up`) so a latency sensitive strategy reacts without waiting for the next tick.
+        """
+        self._top_of_book_listeners[trading_pair].append(listener)
+
+    def remove_top_of_book_listener(self, trading_pair: str, listener: Callable[[str], None]):
+        if listener in self._top_of_book_listeners.get(trading_pair, []):
+            self._top_of_book_listeners[trading_pair].remove(listener)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,6 +137,12 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def tracking_metrics(self) -> Dict[str, OrderBookTrackingMetrics]:
+        for trading_pair, message_queue in self._tracking_message_queues.items():
+            self._tracking_metrics[trading_pair].queue_depth = message_queue.qsize()
+        return dict(self._tracking_metrics)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -138,6 +206,8 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_books_ready.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
@@ -174,17 +244,47 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. The snapshots are requested concurrently (the connector's throttler keeps the requests
+        within the exchange rate limits) and each order book starts being tracked, replaying the diffs received
+        while its snapshot was being requested, as soon as its snapshot arrives.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS)
+        await safe_gather(*[
+            self._init_order_book(trading_pair=trading_pair, semaphore=semaphore)
+            for trading_pair in self._trading_pairs
+        ])
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore):
+        order_book: Optional[OrderBook] = None
+        while order_book is None:
+            try:
+                async with semaphore:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing order book for {trading_pair}. "
+                                    f"Retrying after {self.ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL} seconds."
+                )
+                await self._sleep(delay=self.ORDER_BOOK_INITIALIZATION_RETRY_INTERVAL)
+
+        # The saved snapshots older than the initial one would take the order book back, so they are discarded
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        self._saved_message_queues[trading_pair] = deque(
+            (message for message in saved_messages
+             if message.type is not OrderBookMessageType.SNAPSHOT or message.update_id >= order_book.snapshot_uid),
+            maxlen=saved_messages.maxlen)
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_books_ready[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self.ready_trading_pairs)}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -238,12 +338,13 @@ class OrderBookTracker:
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
+                    # Save snapshot messages received before the order book is initialized, like the diff messages
+                    self._saved_message_queues[trading_pair].append(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 await message_queue.put(ob_message)
@@ -258,6 +359,7 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        metrics: OrderBookTrackingMetrics = self._tracking_metrics[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
@@ -271,20 +373,32 @@ class OrderBookTracker:
                 else:
                     message = await message_queue.get()
 
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                messages: List[OrderBookMessage] = [message]
+                if self._coalesce_diffs:
+                    messages.extend(self._drain_pending_messages(trading_pair))
+                metrics.queue_depth = len(messages) + message_queue.qsize()
+                metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+
+                pending_diffs: List[OrderBookMessage] = []
+                for message in messages:
+                    if message.type is OrderBookMessageType.DIFF:
+                        pending_diffs.append(message)
+                        past_diffs_window.append(message)
+                        diff_messages_accepted += 1
+                    elif message.type is OrderBookMessageType.SNAPSHOT:
+                        self._apply_diff_messages(order_book, pending_diffs, metrics)
+                        pending_diffs = []
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                self._apply_diff_messages(order_book, pending_diffs, metrics)
+                self._notify_top_of_book_change(trading_pair, order_book)
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
+                    diff_messages_accepted = 0
+                last_message_timestamp = now
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,11 +409,95 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _notify_top_of_book_change(self, trading_pair: str, order_book: OrderBook):
+        listeners: List[Callable[[str], None]] = self._top_of_book_listeners.get(trading_pair)
+        if not listeners:
+            return
+        bids, asks = order_book.get_snapshot_arrays(depth=1)
+        top_of_book = (tuple(bids[0, :2]) if len(bids) > 0 else None, tuple(asks[0, :2]) if len(asks) > 0 else None)
+        if top_of_book == self._top_of_book.get(trading_pair):
+            return
+        self._top_of_book[trading_pair] = top_of_book
+        for listener in listeners:
+            try:
+                listener(trading_pair)
+            except Exception:
+                self.logger().error(f"Unexpected error notifying the top of book change for {trading_pair}.",
+                                    exc_info=True)
+
+    def _drain_pending_messages(self, trading_pair: str) -> List[OrderBookMessage]:
+        """
+        Removes and returns, in arrival order, all the messages already waiting to be processed for the trading pair
+        """
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+        messages: List[OrderBookMessage] = list(saved_messages)
+        saved_messages.clear()
+        while not message_queue.empty():
+            messages.append(message_queue.get_nowait())
+        return messages
+
+    def _apply_diff_messages(
+        self,
+        order_book: OrderBook,
+        diff_messages: List[OrderBookMessage],
+        metrics: OrderBookTrackingMetrics,
+    ):
+        if len(diff_messages) == 0:
+            return
+        last_message = diff_messages[-1]
+        coalesced: bool = len(diff_messages) > 1 and self.can_coalesce_diff_messages(diff_messages)
+        if coalesced:
+            bids, asks = self.coalesce_diff_messages(diff_messages)
+            order_book.apply_numpy_diffs(bids, asks, last_message.update_id)
+        else:
+            # Update ids too large for the coalesced arrays (e.g. nanosecond based sequences) are applied one by one
+            for message in diff_messages:
+                order_book.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+
+        metrics.last_batch_size = len(diff_messages)
+        metrics.diffs_applied += len(diff_messages)
+        if coalesced:
+            metrics.diffs_coalesced += len(diff_messages) - 1
+        if last_message.timestamp is not None:
+            metrics.lag = max(0.0, time.time() - last_message.timestamp)
+            metrics.max_lag = max(metrics.max_lag, metrics.lag)
+
+    @classmethod
+    def can_coalesce_diff_messages(cls, diff_messages: List[OrderBookMessage]) -> bool:
+        return all(abs(message.update_id) < cls.MAX_COALESCED_UPDATE_ID for message in diff_messages)
+
+    @classmethod
+    def coalesce_diff_messages(cls, diff_messages: List[OrderBookMessage]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Merges a sequence of diff messages (in update order) into one net update per side. When a price level is
+        updated by several messages only the last update is kept (last write wins), and every level keeps the update
+        id of the message it comes from, so the book resolves crossed levels the same way it would applying the
+        messages one by one.
+        The update ids must be lower than MAX_COALESCED_UPDATE_ID, so they are exact in the float64 arrays.
+        :return: the bids and asks as [price, amount, update_id] float64 arrays
+        """
+        if not cls.can_coalesce_diff_messages(diff_messages):
+            raise ValueError(f"Diff messages with update ids from {cls.MAX_COALESCED_UPDATE_ID} on can't be coalesced.")
+        bids = cls._coalesce_levels([(message.bids_array, message.update_id) for message in diff_messages])
+        asks = cls._coalesce_levels([(message.asks_array, message.update_id) for message in diff_messages])
+        return bids, asks
+
+    @staticmethod
+    def _coalesce_levels(levels_with_update_ids: List[Tuple[np.ndarray, int]]) -> np.ndarray:
+        stacked_levels = np.concatenate([
+            np.column_stack((levels[:, :2], np.full(len(levels), update_id, dtype=np.float64)))
+            for levels, update_id in levels_with_update_ids
+        ])
+        # np.unique returns the first occurrence of each price, so the levels are reversed to keep the last write
+        reversed_levels = stacked_levels[::-1]
+        _, last_write_indexes = np.unique(reversed_levels[:, 0], return_index=True)
+        return reversed_levels[last_write_indexes]
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
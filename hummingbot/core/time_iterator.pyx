@@ -25,6 +25,16 @@ cdef class TimeIterator(PubSub):
     def tick(self, timestamp: float):
         self.c_tick(timestamp)
 
+    def next_event_timestamp(self) -> float:
+        """
+        Used by back testing clocks that skip idle ticks. Iterators whose state only changes on known events (e.g. the
+        next row of historical data, or a strategy timer) return the timestamp of the next one, and are guaranteed to
+        be ticked on the first tick at or after it.
+        NaN means the iterator can change its state on any tick, so no tick is skipped. None of the connectors and
+        strategies of the client override it, so the skipping only applies to back tests made of custom iterators.
+        """
+        return NaN
+
     @property
     def current_timestamp(self) -> float:
         return self._current_timestamp
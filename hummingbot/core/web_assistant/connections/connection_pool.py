@@ -0,0 +1,86 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import aiohttp
+
+
+@dataclass(frozen=True)
+class ConnectionPoolSettings:
+    """Settings of the HTTP connection pool of the web assistants.
+
+    `limit` and `limit_per_host` cap the connections open at the same time (0 means no limit), `keepalive_timeout` is
+    how long, in seconds, an idle connection is kept open to be reused, and `dns_cache_ttl` is how long, in seconds,
+    the resolved addresses of a host are reused (None caches them forever). `prewarm_connections` is the number of
+    connections the connectors open to their REST host when they start, so the first orders do not pay for the TCP and
+    TLS handshakes. The client sockets are always opened with TCP_NODELAY by aiohttp.
+    """
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: Optional[int] = 60
+    prewarm_connections: int = 0
+
+    def build_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+
+class ConnectionMetrics:
+    """Counts, per host, the requests sent through a new connection (with its TCP and TLS handshakes) and the
+    requests that reused an idle connection of the pool."""
+
+    def __init__(self):
+        self._new_connections: Dict[str, int] = defaultdict(int)
+        self._reused_connections: Dict[str, int] = defaultdict(int)
+
+    @property
+    def hosts(self) -> List[str]:
+        return sorted(set(self._new_connections) | set(self._reused_connections))
+
+    def new_connections(self, host: str) -> int:
+        return self._new_connections.get(host, 0)
+
+    def reused_connections(self, host: str) -> int:
+        return self._reused_connections.get(host, 0)
+
+    def reuse_ratio(self, host: str) -> float:
+        total = self.new_connections(host) + self.reused_connections(host)
+        return self.reused_connections(host) / total if total > 0 else 0.0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        return trace_config
+
+    async def _on_request_start(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        # The connection events do not include the URL, so the host is kept in the context of the request
+        context.host = params.url.host
+
+    async def _on_connection_create_end(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._new_connections[context.host] += 1
+
+    async def _on_connection_reuseconn(self, session: aiohttp.ClientSession, context: SimpleNamespace, params):
+        self._reused_connections[context.host] += 1
+
+
+_default_connection_pool_settings = ConnectionPoolSettings()
+
+
+def get_default_connection_pool_settings() -> ConnectionPoolSettings:
+    """Returns the settings of the connection pools created by the connections factories."""
+    return _default_connection_pool_settings
+
+
+def set_default_connection_pool_settings(settings: Optional[ConnectionPoolSettings]):
+    """Sets the settings of the connection pools created from now on. None restores the default settings."""
+    global _default_connection_pool_settings
+    _default_connection_pool_settings = settings or ConnectionPoolSettings()
@@ -2,8 +2,14 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.connection_pool import (
+    ConnectionMetrics,
+    ConnectionPoolSettings,
+    get_default_connection_pool_settings,
+)
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.json_codec import JSONCodec
 
 
 class ConnectionsFactory:
@@ -16,24 +22,40 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    All the connections share a session with a connection pool configured with the `ConnectionPoolSettings` given or,
+    if none is given, with the default ones when the first connection is requested.
     """
 
-    def __init__(self):
+    def __init__(self, json_codec: Optional[JSONCodec] = None,
+                 connection_pool_settings: Optional[ConnectionPoolSettings] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._json_codec = json_codec
+        self._connection_pool_settings = connection_pool_settings
+        self._connection_metrics = ConnectionMetrics()
+
+    @property
+    def connection_metrics(self) -> ConnectionMetrics:
+        return self._connection_metrics
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, json_codec=self._json_codec)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None:
+            settings = self._connection_pool_settings or get_default_connection_pool_settings()
+            self._shared_client = aiohttp.ClientSession(
+                connector=settings.build_connector(),
+                trace_configs=[self._connection_metrics.trace_config()],
+            )
         return self._shared_client
@@ -7,13 +7,15 @@ import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_default_json_codec
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
 
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: Optional[JSONCodec] = None):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or get_default_json_codec()
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -141,13 +143,12 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
             try:
-                data = msg.json()
+                data = msg.json(loads=self._json_codec.loads)
             except JSONDecodeError:
                 data = msg.data
         response = WSResponse(data)
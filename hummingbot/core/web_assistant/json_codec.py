@@ -0,0 +1,56 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """Encodes and decodes the JSON payloads of the web assistants with the standard library.
+
+    Numbers are decoded as the standard library does it: integers as `int` and numbers with a fraction or an exponent
+    as `float`. Numbers sent as strings by the exchanges remain strings.
+    """
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonCodec(JSONCodec):
+    """Decodes JSON payloads with orjson, faster than the standard library.
+
+    orjson decodes numbers to the same types as the standard library: integers as `int`, numbers with a fraction or an
+    exponent as `float` and numbers sent as strings remain strings. The only exception are the integers out of the 64
+    bits range, which orjson decodes as `float`; connectors receiving such numbers should use `JSONCodec`. The payloads
+    orjson rejects but the standard library accepts (e.g. `NaN`) are decoded with the standard library. The payloads
+    are encoded with the standard library, which keeps the separators the exchanges signatures are computed over.
+    """
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+
+_default_json_codec: Optional[JSONCodec] = None
+
+
+def get_default_json_codec() -> JSONCodec:
+    """Returns the codec used by the web assistants created without one: orjson if it is installed, the standard
+    library otherwise."""
+    global _default_json_codec
+    if _default_json_codec is None:
+        _default_json_codec = OrjsonCodec() if orjson is not None else JSONCodec()
+    return _default_json_codec
+
+
+def set_default_json_codec(codec: Optional[JSONCodec]):
+    """Sets the codec used by the web assistants created without one. None restores the automatic choice."""
+    global _default_json_codec
+    _default_json_codec = codec
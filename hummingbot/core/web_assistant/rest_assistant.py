@@ -1,12 +1,12 @@
-import json
 from asyncio import wait_for
-from copy import deepcopy
+from copy import copy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.json_codec import JSONCodec, get_default_json_codec
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 
@@ -17,7 +17,15 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    The pre-processors and the authenticator receive a copy of the request they can modify freely: a shallow copy of
+    the request with its own `params`, `headers` and `data` containers, so the caller's request and dictionaries are
+    never changed. The values inside those containers are shared and must not be modified in place.
     """
+
+    _GET_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+    _BODY_HEADERS = {"Content-Type": "application/json"}
+
     def __init__(
         self,
         connection: RESTConnection,
@@ -25,12 +33,14 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._json_codec = json_codec or get_default_json_codec()
 
     async def execute_request(
         self,
@@ -71,19 +81,15 @@ class RESTAssistant:
             headers: Optional[Dict[str, Any]] = None,
     ) -> RESTResponse:
 
-        headers = headers or {}
-
-        local_headers = {
-            "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
+        local_headers = {**(self._GET_HEADERS if method == RESTMethod.GET else self._BODY_HEADERS), **(headers or {})}
 
-        local_headers.update(headers)
-
-        data = json.dumps(data) if data is not None else data
+        data = self._json_codec.dumps(data) if data is not None else data
 
+        # The request is built here with its own params and headers, so it does not need the copy done by `call`
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=self._copy_container(params),
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
@@ -91,7 +97,7 @@ class RESTAssistant:
         )
 
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+            response = await self._call(request=request, timeout=timeout)
 
             if 400 <= response.status:
                 if not return_err:
@@ -102,13 +108,28 @@ class RESTAssistant:
             return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        return await self._call(request=self._copy_request(request), timeout=timeout)
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
         resp = await self._post_process_response(resp)
         return resp
 
+    @classmethod
+    def _copy_request(cls, request: RESTRequest) -> RESTRequest:
+        request_copy = copy(request)
+        request_copy.params = cls._copy_container(request.params)
+        request_copy.headers = cls._copy_container(request.headers)
+        request_copy.data = cls._copy_container(request.data)
+        return request_copy
+
+    @staticmethod
+    def _copy_container(value: Any) -> Any:
+        # Strings and bytes are immutable, and any other value is passed to aiohttp as it is
+        return copy(value) if isinstance(value, (dict, list)) else value
+
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
         for pre_processor in self._rest_pre_processors:
             request = await pre_processor.pre_process(request)
@@ -2,7 +2,9 @@ from typing import List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.connection_pool import ConnectionMetrics, ConnectionPoolSettings
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.json_codec import JSONCodec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -29,8 +31,12 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
+        connection_pool_settings: Optional[ConnectionPoolSettings] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(
+            json_codec=json_codec, connection_pool_settings=connection_pool_settings)
+        self._json_codec = json_codec
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -46,6 +52,10 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connection_metrics(self) -> ConnectionMetrics:
+        return self._connections_factory.connection_metrics
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
@@ -53,7 +63,8 @@ class WebAssistantsFactory:
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            json_codec=self._json_codec,
         )
         return assistant
 
@@ -15,6 +15,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
@@ -45,6 +46,8 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    # Candles stored on disk, used for the historical candles when set
+    candles_cache: Optional[CandlesCache] = None
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
@@ -162,25 +165,15 @@ class CandlesBase(NetworkBase):
         self._candles.extendleft(df.values.tolist())
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
         try:
             await self.initialize_exchange_data()
-            current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
-            current_start_time = self._round_timestamp_to_interval_multiple(config.start_time)
-            while current_end_time >= current_start_time:
-                missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
-                candles = await self.fetch_candles(start_time=current_start_time,
-                                                   end_time=current_end_time,
-                                                   limit=missing_records)
-                if len(candles) <= 1 or missing_records == 0:
-                    break
-                candles = candles[candles[:, 0] <= current_end_time]
-                current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
+            start_time = self._round_timestamp_to_interval_multiple(config.start_time)
+            end_time = self._round_timestamp_to_interval_multiple(config.end_time)
+            if self.candles_cache is None:
+                candles_df = await self._fetch_historical_candles(start_time=start_time, end_time=end_time)
+            else:
+                candles_df = pd.DataFrame(await self._get_candles_through_cache(start_time=start_time, end_time=end_time),
+                                          columns=self.columns)
             candles_df = candles_df[
                 (candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
             return candles_df
@@ -191,6 +184,61 @@ class CandlesBase(NetworkBase):
             self.logger().exception(f"Error fetching historical candles: {str(e)}")
             raise e
 
+    async def _fetch_historical_candles(self, start_time: int, end_time: int) -> pd.DataFrame:
+        """
+        This method pages through the REST API to download the candles from start time to end time.
+        :param start_time: timestamp of the first candle, rounded to the interval
+        :param end_time: timestamp of the last candle, rounded to the interval
+        """
+        candles_df = pd.DataFrame()
+        current_end_time = end_time
+        current_start_time = start_time
+        while current_end_time >= current_start_time:
+            missing_records = int((current_end_time - current_start_time) / self.interval_in_seconds)
+            candles = await self.fetch_candles(start_time=current_start_time,
+                                               end_time=current_end_time,
+                                               limit=missing_records)
+            if len(candles) <= 1 or missing_records == 0:
+                break
+            candles = candles[candles[:, 0] <= current_end_time]
+            current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
+            fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
+            candles_df = pd.concat([fetched_candles_df, candles_df])
+            candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+            candles_df.reset_index(drop=True, inplace=True)
+            self.check_candles_sorted_and_equidistant(candles_df.values)
+        return candles_df if not candles_df.empty else pd.DataFrame(columns=self.columns, dtype=float)
+
+    async def _get_candles_through_cache(self, start_time: int, end_time: int) -> np.ndarray:
+        """
+        This method returns the candles from start time to end time, downloading only the ones missing in the candles
+        cache. The closed candles downloaded are stored in the cache, the candle still open is not.
+        :param start_time: timestamp of the first candle, rounded to the interval
+        :param end_time: timestamp of the last candle, rounded to the interval
+        """
+        last_closed_candle_time = self._round_timestamp_to_interval_multiple(self._time()) - self.interval_in_seconds
+        closed_candles = []
+        covered_ranges = []
+        open_candles = []
+        for missing_start, missing_end in self.candles_cache.get_missing_ranges(
+                self.name, self.interval, self.interval_in_seconds, start_time, end_time):
+            # One candle more is requested, because the paging stops when the exchange returns a single candle
+            candles = (await self._fetch_historical_candles(start_time=missing_start - self.interval_in_seconds,
+                                                            end_time=missing_end)).to_numpy(dtype=float)
+            candles = candles[(candles[:, 0] >= missing_start) & (candles[:, 0] <= missing_end)]
+            range_closed_candles = candles[candles[:, 0] <= last_closed_candle_time]
+            if len(range_closed_candles) > 0:
+                # Only the range of the candles returned is covered, the rest of the range is requested again
+                closed_candles.append(range_closed_candles)
+                covered_ranges.append((int(range_closed_candles[:, 0].min()), int(range_closed_candles[:, 0].max())))
+            open_candles.append(candles[candles[:, 0] > last_closed_candle_time])
+        if len(covered_ranges) > 0:
+            self.candles_cache.add_candles(self.name, self.interval, self.interval_in_seconds,
+                                           np.concatenate(closed_candles), covered_ranges)
+        candles = np.concatenate([self.candles_cache.get_candles(self.name, self.interval, start_time, end_time,
+                                                                 len(self.columns))] + open_candles)
+        return candles[np.argsort(candles[:, 0], kind="stable")]
+
     def check_candles_sorted_and_equidistant(self, candles: np.ndarray):
         """
         This method checks if the given candles are sorted by timestamp in ascending order and equidistant.
@@ -327,7 +375,12 @@ class CandlesBase(NetworkBase):
             try:
                 end_time = self._round_timestamp_to_interval_multiple(self._candles[0][0])
                 missing_records = self._candles.maxlen - len(self._candles)
-                candles: np.ndarray = await self.fetch_candles(end_time=end_time, limit=missing_records)
+                if self.candles_cache is None:
+                    candles: np.ndarray = await self.fetch_candles(end_time=end_time, limit=missing_records)
+                else:
+                    candles: np.ndarray = await self._get_candles_through_cache(
+                        start_time=end_time - missing_records * self.interval_in_seconds,
+                        end_time=end_time - self.interval_in_seconds)
                 candles = candles[candles[:, 0] < end_time]
                 records_to_add = min(missing_records, len(candles))
                 self._candles.extendleft(candles[-records_to_add:][::-1])
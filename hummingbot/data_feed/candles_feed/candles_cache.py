@@ -0,0 +1,121 @@
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot import data_path
+
+
+class CandlesCache:
+    """
+    Stores closed candles on disk, so the candles of a time range are only downloaded once.
+
+    The candles of every feed and interval are kept sorted by timestamp in a NumPy file, which is read memory mapped,
+    next to a JSON file with the time ranges already downloaded. Only the time range of the candles a download returned
+    is recorded, so the candles missing in a response (e.g. when a download stopped early) are requested again.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        self._cache_path = cache_path or os.path.join(data_path(), "candles")
+        self._candles: Dict[str, np.ndarray] = {}
+        self._covered_ranges: Dict[str, List[Tuple[int, int]]] = {}
+
+    @property
+    def cache_path(self) -> str:
+        return self._cache_path
+
+    @staticmethod
+    def _key(feed_name: str, interval: str) -> str:
+        return f"{feed_name}_{interval}"
+
+    def _candles_file_path(self, key: str) -> str:
+        return os.path.join(self._cache_path, f"{key}.npy")
+
+    def _ranges_file_path(self, key: str) -> str:
+        return os.path.join(self._cache_path, f"{key}_ranges.json")
+
+    def _load_candles(self, key: str, columns: int) -> np.ndarray:
+        if key not in self._candles:
+            file_path = self._candles_file_path(key)
+            if os.path.exists(file_path):
+                self._candles[key] = np.load(file_path, mmap_mode="r")
+            else:
+                self._candles[key] = np.empty((0, columns))
+        return self._candles[key]
+
+    def get_covered_ranges(self, feed_name: str, interval: str) -> List[Tuple[int, int]]:
+        key = self._key(feed_name, interval)
+        if key not in self._covered_ranges:
+            file_path = self._ranges_file_path(key)
+            if os.path.exists(file_path):
+                with open(file_path) as ranges_file:
+                    self._covered_ranges[key] = [(int(start), int(end)) for start, end in json.load(ranges_file)]
+            else:
+                self._covered_ranges[key] = []
+        return self._covered_ranges[key]
+
+    def get_missing_ranges(self, feed_name: str, interval: str, interval_in_seconds: int,
+                           start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """
+        Returns the time ranges, with the timestamps of their first and last candles, that have to be downloaded to
+        have every candle from start time to end time.
+        """
+        missing_ranges = []
+        next_start = start_time
+        for covered_start, covered_end in self.get_covered_ranges(feed_name, interval):
+            if covered_end < next_start:
+                continue
+            if covered_start > end_time:
+                break
+            if covered_start > next_start:
+                missing_ranges.append((next_start, covered_start - interval_in_seconds))
+            next_start = max(next_start, covered_end + interval_in_seconds)
+        if next_start <= end_time:
+            missing_ranges.append((next_start, end_time))
+        return missing_ranges
+
+    def get_candles(self, feed_name: str, interval: str, start_time: int, end_time: int, columns: int) -> np.ndarray:
+        candles = self._load_candles(self._key(feed_name, interval), columns)
+        first = np.searchsorted(candles[:, 0], start_time, side="left")
+        last = np.searchsorted(candles[:, 0], end_time, side="right")
+        return np.array(candles[first:last])
+
+    def add_candles(self, feed_name: str, interval: str, interval_in_seconds: int, candles: np.ndarray,
+                    covered_ranges: List[Tuple[int, int]]):
+        """
+        Stores the candles downloaded for the time ranges, with the timestamps of their first and last candles. The
+        candles are a two dimensional array with the timestamp in the first column. The candles file is rewritten on
+        every call, so the candles of all the ranges downloaded together should be added at once.
+        """
+        key = self._key(feed_name, interval)
+        os.makedirs(self._cache_path, exist_ok=True)
+        candles = np.asarray(candles, dtype=float)
+        stored_candles = self._load_candles(key, candles.shape[1])
+        if len(stored_candles) > 0:
+            candles = np.concatenate([candles, stored_candles])
+        # The downloaded candles go first, so they replace the stored ones with the same timestamp
+        _, unique_indexes = np.unique(candles[:, 0], return_index=True)
+        candles = candles[unique_indexes]
+        self._write(self._candles_file_path(key), lambda file: np.save(file, candles))
+        self._candles[key] = candles
+
+        ranges = sorted(self.get_covered_ranges(feed_name, interval) +
+                        [(int(start), int(end)) for start, end in covered_ranges])
+        merged_ranges = [ranges[0]]
+        for range_start, range_end in ranges[1:]:
+            last_start, last_end = merged_ranges[-1]
+            if range_start <= last_end + interval_in_seconds:
+                merged_ranges[-1] = (last_start, max(last_end, range_end))
+            else:
+                merged_ranges.append((range_start, range_end))
+        self._write(self._ranges_file_path(key), lambda file: file.write(json.dumps(merged_ranges).encode()))
+        self._covered_ranges[key] = merged_ranges
+
+    @staticmethod
+    def _write(file_path: str, write_function):
+        # The file is replaced at once, so a reader never finds it half written
+        temporary_file_path = f"{file_path}.tmp"
+        with open(temporary_file_path, "wb") as file:
+            write_function(file)
+        os.replace(temporary_file_path, file_path)
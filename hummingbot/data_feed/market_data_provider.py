@@ -4,6 +4,7 @@ import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -12,9 +13,11 @@ from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
@@ -30,8 +33,12 @@ class MarketDataProvider:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, connectors: Dict[str, ConnectorBase], rates_update_interval: int = 60):
+    def __init__(self,
+                 connectors: Dict[str, ConnectorBase],
+                 rates_update_interval: int = 60,
+                 candles_cache: Optional[CandlesCache] = None):
         self.candles_feeds = {}  # Stores instances of candle feeds
+        self.candles_cache = candles_cache  # Stores on disk the historical candles of the feeds
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
@@ -141,6 +148,7 @@ class MarketDataProvider:
         else:
             # Create a new feed or restart the existing one with updated max_records
             candle_feed = CandlesFactory.get_candle(config)
+            candle_feed.candles_cache = self.candles_cache
             self.candles_feeds[key] = candle_feed
             if hasattr(candle_feed, 'start'):
                 candle_feed.start()
@@ -275,16 +283,35 @@ class MarketDataProvider:
         order_book = self.get_order_book(connector_name, trading_pair)
         return order_book.get_price_for_volume(is_buy, volume)
 
-    def get_order_book_snapshot(self, connector_name, trading_pair) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def get_order_book_snapshot(self, connector_name, trading_pair,
+                                depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
         Retrieves the order book snapshot for a trading pair from the specified connector, as a tuple of bid and ask in
         DataFrame format.
         :param connector_name: str
         :param trading_pair: str
+        :param depth: number of levels per side to include, all the levels if None
         :return: Tuple of bid and ask in DataFrame format.
         """
         order_book = self.get_order_book(connector_name, trading_pair)
-        return order_book.snapshot
+        if depth is None:
+            return order_book.snapshot
+        bids, asks = order_book.get_snapshot_arrays(depth=depth)
+        return (pd.DataFrame(data=bids, columns=OrderBookRow._fields),
+                pd.DataFrame(data=asks, columns=OrderBookRow._fields))
+
+    def get_order_book_snapshot_arrays(self, connector_name: str, trading_pair: str,
+                                       depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieves the top levels of the order book for a trading pair from the specified connector, as
+        [price, amount, update_id] arrays, without building DataFrames.
+        :param connector_name: str
+        :param trading_pair: str
+        :param depth: number of levels per side to include, all the levels if None
+        :return: Tuple of bid and ask arrays.
+        """
+        order_book = self.get_order_book(connector_name, trading_pair)
+        return order_book.get_snapshot_arrays(depth=depth)
 
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
@@ -28,6 +28,7 @@ class Migrator:
         original_db_name = Path(original_db_path).stem
         backup_db_path = original_db_path + '.backup_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
         new_db_path = original_db_path + '.new'
+        db_handle.checkpoint()
         copyfile(original_db_path, new_db_path)
         copyfile(original_db_path, backup_db_path)
 
@@ -149,3 +149,38 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddExchangeAndTradingPairToMarketDataPrimaryKey(DatabaseTransformation):
+    # The rows of all the trading pairs of a market data collection round share the same timestamp
+    market_data_migration_queries = [
+        ('create table MarketData_dg_tmp'
+         '(	timestamp BIGINT not null,'
+         '	exchange TEXT not null,'
+         '	trading_pair TEXT not null,'
+         '	mid_price BIGINT not null,'
+         '	best_bid BIGINT not null,'
+         '	best_ask BIGINT not null,'
+         '	order_book JSON,'
+         '	constraint MarketData_pk'
+         '	primary key (timestamp, exchange, trading_pair)'
+         ');'),
+        ('insert into MarketData_dg_tmp(timestamp, exchange, trading_pair, mid_price, best_bid, best_ask, order_book) '
+         'select timestamp, exchange, trading_pair, mid_price, best_bid, best_ask, order_book from MarketData;'),
+        'drop table MarketData;',
+        'alter table MarketData_dg_tmp rename to MarketData;',
+        'create index "timestamp" on MarketData (exchange, trading_pair);'
+    ]
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        for query in self.market_data_migration_queries:
+            db_handle.engine.execute(query)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddExchangeAndTradingPairToMarketDataPrimaryKey"
+
+    @property
+    def to_version(self):
+        return 20261016
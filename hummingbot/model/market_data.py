@@ -13,8 +13,8 @@ class MarketData(HummingbotBase):
     )
 
     timestamp = Column(SqliteDecimal(6), primary_key=True, nullable=False)
-    exchange = Column(Text, nullable=False)
-    trading_pair = Column(Text, nullable=False)
+    exchange = Column(Text, primary_key=True, nullable=False)
+    trading_pair = Column(Text, primary_key=True, nullable=False)
     mid_price = Column(SqliteDecimal(6), nullable=False)
     best_bid = Column(SqliteDecimal(6), nullable=False)
     best_ask = Column(SqliteDecimal(6), nullable=False)
@@ -1,11 +1,12 @@
 import logging
 from enum import Enum
 from os.path import join
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect, text
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
 from hummingbot import data_path
@@ -27,7 +28,7 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20230516"
+    LOCAL_DB_VERSION_VALUE = "20261016"
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -71,8 +72,10 @@ class SQLConnectionManager(TransactionBase):
         db_path = self.create_db_path(db_path, db_name)
         self.db_path = db_path
 
+        self._maintenance_interval: float = 0
         if connection_type is SQLConnectionType.TRADE_FILLS:
-            self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            self._engine: Engine = self._create_engine(client_config_map)
+            self._maintenance_interval = client_config_map.db_mode.get_maintenance_interval()
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -100,9 +103,59 @@ class SQLConnectionManager(TransactionBase):
     def engine(self) -> Engine:
         return self._engine
 
+    @property
+    def maintenance_interval(self) -> float:
+        """
+        Hours between the run_maintenance calls, 0 if the database does not need them
+        """
+        return self._maintenance_interval
+
     def get_new_session(self) -> Session:
         return self._session_cls()
 
+    def _create_engine(self, client_config_map: "ClientConfigAdapter") -> Engine:
+        db_mode = client_config_map.db_mode
+        engine_kwargs: Dict[str, Any] = {}
+        pool_size = db_mode.get_pool_size()
+        if pool_size is not None and self.db_path not in ("", ":memory:"):
+            # SQLite file databases open a new connection for every session by default. The connections are kept
+            # open instead, and can be used from any thread (sessions are never shared between threads).
+            engine_kwargs.update(poolclass=QueuePool,
+                                 pool_size=pool_size,
+                                 connect_args={"check_same_thread": False})
+        engine = create_engine(db_mode.get_url(self.db_path), **engine_kwargs)
+
+        pragmas = db_mode.get_connection_pragmas()
+        if pragmas:
+            event.listen(engine, "connect", lambda connection, _: self._set_connection_pragmas(connection, pragmas))
+        return engine
+
+    @staticmethod
+    def _set_connection_pragmas(dbapi_connection, pragmas: Dict[str, Union[str, int]]):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    def run_maintenance(self, session: Session):
+        """
+        Refreshes the query planner statistics and returns the free pages to the file system (only for SQLite
+        databases created with incremental auto vacuum).
+        """
+        if self._engine.dialect.name == "sqlite":
+            session.execute(text("ANALYZE"))
+            session.execute(text("PRAGMA incremental_vacuum"))
+
+    def checkpoint(self):
+        """
+        Moves the content of the SQLite write-ahead log to the database file, so the file can be copied on its own
+        """
+        if self._engine.dialect.name == "sqlite":
+            with self._engine.connect() as connection:
+                connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+
     def get_local_db_version(self, session: Session):
         query: Query = (session.query(LocalMetadata)
                         .filter(LocalMetadata.key == self.LOCAL_DB_VERSION_KEY))
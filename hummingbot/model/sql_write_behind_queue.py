@@ -0,0 +1,153 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+# A write job adds or updates records in the session it receives. It must not commit the session.
+WriteJob = Callable[[Session], None]
+
+
+@dataclass
+class WriteBehindQueueStats:
+    """
+    Write behind queue counters.
+    queue_depth: jobs waiting to be written
+    max_queue_depth: highest number of jobs that were waiting to be written
+    batches: transactions committed by the writer thread
+    records_written: jobs written to the database
+    failed_records: jobs that could not be written (the error is logged)
+    backpressure_waits: enqueues that had to wait because the queue was full
+    last_flush_latency, max_flush_latency: seconds spent writing and committing a batch
+    """
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    batches: int = 0
+    records_written: int = 0
+    failed_records: int = 0
+    backpressure_waits: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+
+
+class SQLWriteBehindQueue:
+    """
+    Moves database writes out of the caller's thread. Write jobs are queued and a dedicated writer thread runs them
+    in arrival order, grouping all the jobs available at the moment (up to max_batch_size) in a single transaction.
+
+    The queue is bounded: when the writer can not keep up, enqueue blocks until there is room again, so memory stays
+    bounded and no record is dropped. Stopping the queue writes every job enqueued before the call.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: SQLConnectionManager, max_queue_size: int = 10000, max_batch_size: int = 500):
+        self._sql_manager: SQLConnectionManager = sql
+        self._max_batch_size: int = max_batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._stats: WriteBehindQueueStats = WriteBehindQueueStats()
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stop_marker = object()
+
+    @property
+    def stats(self) -> WriteBehindQueueStats:
+        self._stats.queue_depth = self._queue.qsize()
+        return self._stats
+
+    @property
+    def started(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    def start(self):
+        if not self.started:
+            self._writer_thread = threading.Thread(target=self._write_loop, name="sql-write-behind", daemon=True)
+            self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Waits until all the jobs enqueued so far are written and then stops the writer thread.
+        """
+        if self.started:
+            self._queue.put(self._stop_marker)
+            self._writer_thread.join(timeout)
+        self._writer_thread = None
+
+    def enqueue(self, job: WriteJob):
+        if not self.started:
+            raise EnvironmentError("The write behind queue is not running.")
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._stats_lock:
+                self._stats.backpressure_waits += 1
+            self._queue.put(job)
+        depth = self._queue.qsize()
+        if depth > self._stats.max_queue_depth:
+            self._stats.max_queue_depth = depth
+
+    def flush(self):
+        """
+        Blocks until all the jobs enqueued so far are written.
+        """
+        self._queue.join()
+
+    def _write_loop(self):
+        running = True
+        while running:
+            jobs: List[WriteJob] = [self._queue.get()]
+            while len(jobs) < self._max_batch_size and jobs[-1] is not self._stop_marker:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if jobs[-1] is self._stop_marker:
+                jobs.pop()
+                running = False
+            try:
+                if jobs:
+                    self._write_batch(jobs)
+            finally:
+                for _ in range(len(jobs) + (0 if running else 1)):
+                    self._queue.task_done()
+
+    def _write_batch(self, jobs: List[WriteJob]):
+        start = time.perf_counter()
+        try:
+            self._run_in_transaction(jobs)
+            written, failed = len(jobs), 0
+        except Exception:
+            # One bad record must not lose the rest of the batch, they are written one per transaction instead
+            written, failed = 0, 0
+            for job in jobs:
+                try:
+                    self._run_in_transaction([job])
+                    written += 1
+                except Exception:
+                    failed += 1
+                    self.logger().error("Unexpected error while writing a record to the database.", exc_info=True)
+        latency = time.perf_counter() - start
+        with self._stats_lock:
+            self._stats.batches += 1
+            self._stats.records_written += written
+            self._stats.failed_records += failed
+            self._stats.last_flush_latency = latency
+            self._stats.max_flush_latency = max(self._stats.max_flush_latency, latency)
+
+    def _run_in_transaction(self, jobs: List[WriteJob]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for job in jobs:
+                    job(session)
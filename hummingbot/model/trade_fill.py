@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 import numpy
 import pandas as pd
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text
+from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text, type_coerce
 from sqlalchemy.orm import Session, relationship
 
 from hummingbot.core.event.events import PositionAction
@@ -89,6 +89,41 @@ class TradeFill(HummingbotBase):
                                              .all())
         return trades
 
+    @staticmethod
+    def get_trades_frame(sql_session: Session,
+                         start_time: int,
+                         config_file_path: str = None) -> pd.DataFrame:
+        """
+        Loads the columns used by the performance calculations as a DataFrame, without building the ORM objects.
+        The price and amount columns are the integers stored in the DB (see price_amount_scale).
+        """
+        filters = [TradeFill.timestamp >= start_time]
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path == config_file_path)
+        columns = [TradeFill.market,
+                   TradeFill.symbol,
+                   TradeFill.timestamp,
+                   TradeFill.trade_type,
+                   type_coerce(TradeFill.price, BigInteger).label("price"),
+                   type_coerce(TradeFill.amount, BigInteger).label("amount"),
+                   TradeFill.trade_fee,
+                   TradeFill.position]
+        rows = (sql_session
+                .query(*columns)
+                .filter(*filters)
+                .order_by(TradeFill.timestamp.asc())
+                .all())
+        return pd.DataFrame(data=rows,
+                            columns=["market", "symbol", "timestamp", "trade_type", "price", "amount", "trade_fee",
+                                     "position"])
+
+    @staticmethod
+    def price_amount_scale() -> int:
+        """
+        The number of decimal digits of the price and amount integers stored in the DB
+        """
+        return TradeFill.__table__.c.price.type.scale
+
     @classmethod
     def to_pandas(cls, trades: List):
         columns: List[str] = ["Id",
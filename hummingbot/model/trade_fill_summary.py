@@ -0,0 +1,37 @@
+from typing import List
+
+from sqlalchemy import JSON, BigInteger, Column, Integer, Text
+from sqlalchemy.orm import Session
+
+from hummingbot.model import HummingbotBase
+
+
+class TradeFillSummary(HummingbotBase):
+    """
+    Running totals of all the trade fills of a strategy config file in a market and trading pair, updated in the same
+    transaction as each fill. The start timestamp is the timestamp of the first fill and the last timestamp the one of
+    the last fill included. The metrics are the JSON representation of a PerformanceAccumulator.
+    """
+    __tablename__ = "TradeFillSummary"
+
+    config_file_path = Column(Text, primary_key=True, nullable=False)
+    market = Column(Text, primary_key=True, nullable=False)
+    symbol = Column(Text, primary_key=True, nullable=False)
+    start_timestamp = Column(BigInteger, primary_key=True, nullable=False)
+    last_timestamp = Column(BigInteger, nullable=False)
+    num_trades = Column(Integer, nullable=False)
+    metrics = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradeFillSummary(config_file_path='{self.config_file_path}', market='{self.market}', " \
+               f"symbol='{self.symbol}', start_timestamp={self.start_timestamp}, " \
+               f"last_timestamp={self.last_timestamp}, num_trades={self.num_trades}, metrics={self.metrics})"
+
+    @staticmethod
+    def get_summaries(sql_session: Session,
+                      config_file_path: str) -> List["TradeFillSummary"]:
+        return (sql_session
+                .query(TradeFillSummary)
+                .filter(TradeFillSummary.config_file_path == config_file_path)
+                .order_by(TradeFillSummary.last_timestamp.asc())
+                .all())
@@ -84,6 +84,22 @@ class ScriptStrategyBase(StrategyPyBase):
     async def on_stop(self):
         pass
 
+    def wake_up_on_top_of_book_changes(self, connector_name: str, trading_pairs: List[str]):
+        """
+        Ticks the strategy as soon as the best bid or the best ask of the trading pairs changes, without waiting for
+        the next tick (real time mode only). The connector must track its order books with an OrderBookTracker.
+
+        :param connector_name: The name of the connector
+        :param trading_pairs: The trading pairs to watch
+        """
+        order_book_tracker = self.connectors[connector_name].order_book_tracker
+        for trading_pair in trading_pairs:
+            order_book_tracker.add_top_of_book_listener(trading_pair, self._on_watched_top_of_book_change)
+
+    def _on_watched_top_of_book_change(self, trading_pair: str):
+        if self.clock is not None:
+            self.clock.wake_up([self])
+
     def buy(self,
             connector_name: str,
             trading_pair: str,